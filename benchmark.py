@@ -0,0 +1,174 @@
+import argparse
+import csv
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+import networkx as nx
+
+from graph_search.datasets import GENERATORS
+from graph_search.report import percentile
+from graph_search.search import ALGORITHMS, GraphSearchComparison
+
+DEFAULT_SIZES = (10**2, 10**3, 10**4, 10**5, 10**6)
+
+FIELDS = ['generator', 'nodes', 'edges', 'algorithm', 'engine', 'compact', 'start', 'goal', 'warmup', 'repeats',
+          'min_ns', 'median_ns', 'p95_ns', 'mean_ns', 'path_length', 'nodes_explored',
+          'peak_frontier', 'peak_visited', 'peak_parent', 'tracemalloc_peak_bytes']
+
+
+def time_search(search: Callable, start: int, goal: int, warmup: int = 2, repeats: int = 10) -> Dict:
+    for _ in range(warmup):
+        search(start, goal)
+    
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            begin = time.perf_counter_ns()
+            path, _, _, explored = search(start, goal)
+            samples.append(time.perf_counter_ns() - begin)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    
+    return {
+        'min_ns': min(samples),
+        'median_ns': int(statistics.median(samples)),
+        'p95_ns': percentile(samples, 0.95),
+        'mean_ns': int(statistics.fmean(samples)),
+        'path_length': len(path),
+        'nodes_explored': explored,
+    }
+
+
+def run_benchmarks(sizes: Sequence[int] = DEFAULT_SIZES, generators: Sequence[str] = tuple(GENERATORS),
+                   algorithms: Sequence[str] = ('dfs', 'bfs'), engine: str = 'networkx', compact: bool = False,
+                   warmup: int = 2, repeats: int = 10, seed: int = 42, measure_memory: bool = True,
+                   verbose: bool = True, trace_dir: Optional[str] = None) -> List[Dict]:
+    # With trace_dir, dfs/bfs get one extra profiled run per case: its
+    # counters go into the record and its Chrome trace into trace_dir
+    records = []
+    for generator in generators:
+        for size in sizes:
+            csr = GENERATORS[generator](size, seed)
+            graph = csr if engine == 'csr' else csr.to_networkx()
+            searcher = GraphSearchComparison(graph, f"{generator}-{size}", engine=engine, compact=compact)
+            if engine == 'csr':
+                searcher.csr
+            start, goal = 0, graph.number_of_nodes() - 1
+            
+            for algorithm in algorithms:
+                record = {
+                    'generator': generator,
+                    'nodes': graph.number_of_nodes(),
+                    'edges': graph.number_of_edges(),
+                    'algorithm': algorithm,
+                    'engine': engine,
+                    'compact': compact,
+                    'start': start,
+                    'goal': goal,
+                    'warmup': warmup,
+                    'repeats': repeats,
+                }
+                record.update(time_search(getattr(searcher, algorithm), start, goal, warmup, repeats))
+                if measure_memory:
+                    record.update(searcher.measure_memory(algorithm, start, goal))
+                if trace_dir and algorithm in ('dfs', 'bfs'):
+                    profiler = searcher.profile(algorithm, start, goal, trace=True)
+                    record.update(profiler.counters)
+                    profiler.write_chrome_trace(os.path.join(trace_dir, f"{generator}-{size}-{algorithm}.trace.json"))
+                records.append(record)
+                if verbose:
+                    print(f"{generator:<8} {record['nodes']:>9} {algorithm:<18} "
+                          f"min {record['min_ns']/1e6:>10.3f} ms | median {record['median_ns']/1e6:>10.3f} ms | "
+                          f"p95 {record['p95_ns']/1e6:>10.3f} ms", file=sys.stderr)
+    return records
+
+
+def environment() -> Dict:
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'networkx': nx.__version__,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    }
+
+
+def write_json(records: List[Dict], path: str):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'environment': environment(), 'results': records}, f, indent=2)
+
+
+def write_csv(records: List[Dict], path: str):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def compare_to_baseline(records: List[Dict], baseline_path: str, threshold: float = 1.10) -> List[Dict]:
+    # Rows whose median got slower than `threshold` × the baseline median
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)['results']
+    key = lambda r: (r['generator'], r['nodes'], r['algorithm'], r['engine'], r.get('compact', False))
+    previous = {key(r): r for r in baseline}
+    
+    regressions = []
+    for record in records:
+        old = previous.get(key(record))
+        if old and record['median_ns'] > old['median_ns'] * threshold:
+            regressions.append({**record, 'baseline_median_ns': old['median_ns'],
+                                'ratio': record['median_ns'] / old['median_ns']})
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="DFS/BFS greitaveikos matavimai")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--generators', nargs='+', choices=list(GENERATORS), default=list(GENERATORS))
+    parser.add_argument('--algorithms', nargs='+', choices=list(ALGORITHMS), default=['dfs', 'bfs'])
+    parser.add_argument('--engine', choices=['networkx', 'csr'], default='networkx')
+    parser.add_argument('--compact', action='store_true', help="kompaktiškos visited/parent struktūros")
+    parser.add_argument('--warmup', type=int, default=2)
+    parser.add_argument('--repeats', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--no-memory', action='store_true', help="nematuoti atminties (tracemalloc)")
+    parser.add_argument('--json', help="rezultatų JSON failas")
+    parser.add_argument('--csv', help="rezultatų CSV failas")
+    parser.add_argument('--baseline', help="ankstesnis JSON rezultatas regresijoms aptikti")
+    parser.add_argument('--threshold', type=float, default=1.10)
+    parser.add_argument('--trace-dir', help="katalogas dfs/bfs Chrome trace failams")
+    args = parser.parse_args(argv)
+    
+    if args.trace_dir:
+        os.makedirs(args.trace_dir, exist_ok=True)
+    records = run_benchmarks(args.sizes, args.generators, args.algorithms, args.engine, args.compact,
+                             args.warmup, args.repeats, args.seed, not args.no_memory, trace_dir=args.trace_dir)
+    if args.json:
+        write_json(records, args.json)
+    if args.csv:
+        write_csv(records, args.csv)
+    if not args.json and not args.csv:
+        json.dump(records, sys.stdout, indent=2)
+        print()
+    
+    if args.baseline:
+        regressions = compare_to_baseline(records, args.baseline, args.threshold)
+        for r in regressions:
+            print(f"REGRESIJA: {r['generator']} {r['nodes']} {r['algorithm']} ({r['engine']}): "
+                  f"{r['baseline_median_ns']/1e6:.3f} -> {r['median_ns']/1e6:.3f} ms (x{r['ratio']:.2f})",
+                  file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""DFS/BFS and related uninformed searches with their comparison tooling.
+
+Public names are loaded on first access, so ``import graph_search`` costs
+almost nothing; networkx, NumPy and matplotlib are only imported by the
+generators, the NumPy kernels and the renderer that need them.
+"""
+import importlib
+
+_EXPORTS = {
+    'GraphSearchComparison': 'search',
+    'DepthLimitedResult': 'search',
+    'ALGORITHMS': 'search',
+    'DATASETS': 'datasets',
+    'GENERATORS': 'datasets',
+    'assign_random_weights': 'datasets',
+    'generate_random_graph': 'datasets',
+    'generate_grid_graph': 'datasets',
+    'generate_tree_graph': 'datasets',
+    'load_or_generate_graph': 'datasets',
+    'percentile': 'report',
+    'print_comparison_results': 'report',
+    'print_comparison_table': 'report',
+    'print_graph_info': 'report',
+    'run_comparison': 'report',
+    'CSRGraph': 'csr_graph',
+    'ComponentIndex': 'components',
+    'ImplicitGraph': 'implicit_graph',
+    'IncrementalBFS': 'dynamic_bfs',
+    'SearchCache': 'search_cache',
+    'SearchProfiler': 'search_profiler',
+    'SearchTree': 'multi_goal',
+    'VisitStream': 'traversal_stream',
+    'ComparisonRenderer': 'visualization',
+    'main': 'cli',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
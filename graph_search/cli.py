@@ -0,0 +1,96 @@
+import argparse
+import os
+import sys
+from typing import List, Optional, Sequence
+
+from .csr_graph import CSRGraph
+from .datasets import DATASETS, GENERATOR_NAMES, GENERATORS, load_or_generate_graph
+from .report import print_conclusion, print_header, run_comparison
+from .search import ALGORITHMS
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m graph_search',
+                                     description="Neinformuotos paieškos algoritmų palyginimas")
+    parser.add_argument('--datasets', type=int, nargs='*', choices=range(1, len(DATASETS) + 1),
+                        help="užduoties duomenų rinkiniai (numatytai visi, jei nenurodyta --sizes/--graph)")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[], help="sugeneruoti N viršūnių grafus")
+    parser.add_argument('--generators', nargs='+', choices=list(GENERATORS), default=list(GENERATORS),
+                        help="generatoriai --sizes grafams")
+    parser.add_argument('--graph', nargs='+', default=[], help="išsaugoti CSR failai (CSRGraph.save)")
+    parser.add_argument('--start', type=int, help="pradžios viršūnė --sizes/--graph grafams (numatytai 0)")
+    parser.add_argument('--goal', type=int, help="tikslo viršūnė --sizes/--graph grafams (numatytai n-1)")
+    parser.add_argument('--algorithms', nargs='+', choices=list(ALGORITHMS), default=['dfs', 'bfs'])
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='.', help="PNG failų katalogas")
+    parser.add_argument('--no-plot', action='store_true', help="nepiešti grafų (matplotlib neįkeliamas)")
+    parser.add_argument('--no-memory', action='store_true', help="nematuoti atminties (tracemalloc)")
+    parser.add_argument('--data-dir', help="katalogas, kuriame saugomi sugeneruoti CSR grafai")
+    return parser
+
+
+def _dataset_numbers(args: argparse.Namespace) -> List[int]:
+    if args.datasets is not None:
+        return args.datasets
+    return [] if args.sizes or args.graph else list(range(1, len(DATASETS) + 1))
+
+
+def _selected_datasets(args: argparse.Namespace) -> List[tuple]:
+    # (graph_name, graph_gen_func, start, goal, cache). Generated and loaded
+    # graphs are built here, so the default goal can be their last node and
+    # --data-dir is applied here with a key holding every generator
+    # parameter; `cache` tells run_comparison to save the fixed DATASETS only
+    selected = [(*DATASETS[number - 1], True) for number in _dataset_numbers(args)]
+    
+    graphs = []
+    for size in args.sizes:
+        for generator in args.generators:
+            graph_gen_func = lambda generator=generator, size=size: GENERATORS[generator](size, args.seed)
+            if args.data_dir is not None:
+                path = os.path.join(args.data_dir, f"{generator}-{size}-seed{args.seed}.csr")
+                graph = load_or_generate_graph(graph_gen_func, path)
+            else:
+                graph = graph_gen_func()
+            graphs.append((f"{GENERATOR_NAMES[generator]} ({graph.number_of_nodes()} viršūnių)", graph))
+    for path in args.graph:
+        graphs.append((os.path.splitext(os.path.basename(path))[0], CSRGraph.load(path)))
+    
+    for graph_name, graph in graphs:
+        start = args.start if args.start is not None else 0
+        goal = args.goal if args.goal is not None else graph.number_of_nodes() - 1
+        selected.append((graph_name, lambda graph=graph: graph, start, goal, False))
+    return selected
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    datasets = _selected_datasets(args)
+    
+    renderer = None
+    if not args.no_plot:
+        # Figures are drawn on a worker thread while the next dataset is searched
+        from .visualization import ComparisonRenderer
+        renderer = ComparisonRenderer(output_dir=args.output, background=True)
+    
+    print_header()
+    for graph_name, graph_gen_func, start_node, goal_node, cache in datasets:
+        run_comparison(graph_gen_func, graph_name, start_node=start_node, goal_node=goal_node,
+                       algorithms=tuple(args.algorithms), measure_memory=not args.no_memory,
+                       render=renderer is not None, renderer=renderer,
+                       data_dir=args.data_dir if cache else None)
+    if _dataset_numbers(args):
+        print_conclusion()
+    
+    if renderer is not None:
+        for path in renderer.wait():
+            print(f"Grafų vizualizacija išsaugota: {path}")
+        renderer.close()
+        print("\n Programa baigta! PNG failai išsaugoti.")
+        print("   Galite juos peržiūrėti savo failų naršyklėje.")
+    else:
+        print("\n Programa baigta!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+from array import array
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from .csr_graph import _reconstruct_path, _record_structures
+
+# DFS/BFS for graphs labelled 0..n-1. Visited is a bytearray (1 byte per
+# node), parents an array('i') (4 bytes) and the visit order a preallocated
+# array('i') buffer, instead of a set, a dict and a list of int objects.
+# The visit order is returned as that buffer trimmed in place, not a list.
+
+
+def compact_dfs(neighbors: Callable[[int], Sequence[int]], num_nodes: int, start: int, goal: int,
+                stats: Optional[dict] = None) -> Tuple[List[int], array]:
+    # Same pop/push discipline as GraphSearchComparison.dfs; `neighbors`
+    # must return the sorted neighbour list.
+    visited = bytearray(num_nodes)
+    parent = array('i', [-1]) * num_nodes
+    parent[start] = start
+    order = array('i', [0]) * num_nodes
+    count = 0
+    stack = array('i', [start])
+    track = stats is not None
+    peak_frontier = 1
+    
+    while stack:
+        node = stack.pop()
+        if visited[node]:
+            continue
+        visited[node] = 1
+        order[count] = node
+        count += 1
+        
+        if node == goal:
+            _record_structures(stats, peak_frontier, count, parent)
+            del order[count:]
+            return _reconstruct_path(parent, start, goal), order
+        
+        for neighbor in reversed(neighbors(node)):
+            if not visited[neighbor]:
+                if parent[neighbor] == -1:
+                    parent[neighbor] = node
+                stack.append(neighbor)
+        
+        if track and len(stack) > peak_frontier:
+            peak_frontier = len(stack)
+    
+    _record_structures(stats, peak_frontier, count, parent)
+    del order[count:]
+    return [], order
+
+
+def compact_bfs(neighbors: Callable[[int], Sequence[int]], num_nodes: int, start: int, goal: int,
+                stats: Optional[dict] = None) -> Tuple[List[int], array]:
+    visited = bytearray(num_nodes)
+    parent = array('i', [-1]) * num_nodes
+    parent[start] = start
+    visited[start] = 1
+    # The order buffer is also the queue: nodes [head, tail) are waiting
+    order = array('i', [0]) * num_nodes
+    order[0] = start
+    head, tail = 0, 1
+    track = stats is not None
+    peak_frontier = 1
+    
+    while head < tail:
+        node = order[head]
+        head += 1
+        
+        if node == goal:
+            _record_structures(stats, peak_frontier, tail, parent)
+            del order[head:]
+            return _reconstruct_path(parent, start, goal), order
+        
+        for neighbor in neighbors(node):
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                parent[neighbor] = node
+                order[tail] = neighbor
+                tail += 1
+        
+        if track and tail - head > peak_frontier:
+            peak_frontier = tail - head
+    
+    _record_structures(stats, peak_frontier, tail, parent)
+    del order[head:]
+    return [], order
@@ -0,0 +1,54 @@
+from typing import Dict, Hashable, Iterable, Tuple
+
+
+class ComponentIndex:
+    """Connected components as a union-find over node labels.
+    
+    Built in one pass over the edges; ``connected(u, v)`` is then two finds
+    (amortized O(α(n)) with path halving and union by size), so a query
+    between components is rejected without any search. Edge insertions are
+    a single ``union``; deletions cannot be undone in a union-find, so the
+    owner rebuilds the index lazily after them.
+    """
+    
+    def __init__(self, nodes: Iterable[Hashable] = (), edges: Iterable[Tuple[Hashable, Hashable]] = ()):
+        self.parent: Dict[Hashable, Hashable] = {}
+        self.size: Dict[Hashable, int] = {}
+        self.count = 0
+        for node in nodes:
+            self.add_node(node)
+        for u, v in edges:
+            self.union(u, v)
+    
+    def add_node(self, node: Hashable):
+        if node not in self.parent:
+            self.parent[node] = node
+            self.size[node] = 1
+            self.count += 1
+    
+    def find(self, node: Hashable) -> Hashable:
+        parent = self.parent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+    
+    def union(self, u: Hashable, v: Hashable):
+        self.add_node(u)
+        self.add_node(v)
+        root_u, root_v = self.find(u), self.find(v)
+        if root_u == root_v:
+            return
+        if self.size[root_u] < self.size[root_v]:
+            root_u, root_v = root_v, root_u
+        self.parent[root_v] = root_u
+        self.size[root_u] += self.size[root_v]
+        self.count -= 1
+    
+    def connected(self, u: Hashable, v: Hashable) -> bool:
+        if u not in self.parent or v not in self.parent:
+            return False
+        return self.find(u) == self.find(v)
+    
+    def component_size(self, node: Hashable) -> int:
+        return self.size[self.find(node)]
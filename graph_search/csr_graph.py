@@ -0,0 +1,360 @@
+import json
+import mmap
+import os
+import tempfile
+from bisect import bisect_left
+import struct
+from array import array
+from typing import List, Optional, Tuple
+
+# magic, format version, node count, neighbour entry count, flags; padded
+# to 32 bytes so the offsets that follow are 8-byte aligned in a mapped file
+_HEADER = struct.Struct('<4sIqqI4x')
+_LENGTH = struct.Struct('<Q')
+_MAGIC = b'CSRG'
+_VERSION = 4
+_HAS_LABELS = 1
+_HAS_WEIGHTS = 2
+_HAS_ATTRS = 4
+# Graph-level attributes kept by from_networkx and stored in the file
+_KEPT_ATTRS = ('grid_shape',)
+
+
+class CSRGraph:
+    """Read-only undirected graph frozen into compressed sparse row arrays.
+    
+    Node ``i`` (an index in ``0..n-1``) has neighbours
+    ``neighbors_idx[offsets[i]:offsets[i + 1]]``, pre-sorted ascending.
+    Indices follow the sorted order of the original labels, so the
+    index-space order matches the label order used by ``dfs``/``bfs``.
+    Edge costs, if any, live in ``weights``, an ``array('d')`` parallel to
+    ``neighbors_idx`` (``None`` means every edge costs 1). ``graph`` holds
+    graph-level attributes like networkx's ``Graph.graph`` (``grid_shape``
+    for the A* heuristic).
+    """
+    
+    def __init__(self, offsets, neighbors_idx, labels: Optional[list] = None, weights=None,
+                 graph: Optional[dict] = None):
+        self.offsets = offsets
+        self.neighbors_idx = neighbors_idx
+        self.labels = labels
+        self.weights = weights
+        self.graph = {} if graph is None else graph
+        self._index = None if labels is None else {label: i for i, label in enumerate(labels)}
+        self._mmap = None
+        self._min_weight = None
+    
+    @classmethod
+    def from_networkx(cls, graph, weight: Optional[str] = 'weight') -> 'CSRGraph':
+        # Edge attribute `weight` is copied into the weights array when at
+        # least one edge has it (missing values count as 1)
+        labels = sorted(graph.nodes())
+        identity = all(isinstance(label, int) and label == i for i, label in enumerate(labels))
+        index = None if identity else {label: i for i, label in enumerate(labels)}
+        weighted = weight is not None and any(weight in data for _, _, data in graph.edges(data=True))
+        
+        offsets = array('q', [0])
+        neighbors_idx = array('i')
+        weights = array('d') if weighted else None
+        adj = graph.adj
+        for label in labels:
+            if index is None:
+                row = sorted(adj[label])
+                neighbors_idx.extend(row)
+            else:
+                row = sorted(adj[label], key=index.__getitem__)
+                neighbors_idx.extend(index[nbr] for nbr in row)
+            if weighted:
+                weights.extend(adj[label][nbr].get(weight, 1.0) for nbr in row)
+            offsets.append(len(neighbors_idx))
+        
+        attrs = {key: graph.graph[key] for key in _KEPT_ATTRS if key in graph.graph}
+        return cls(offsets, neighbors_idx, None if identity else labels, weights, attrs)
+    
+    def with_weights(self, weights) -> 'CSRGraph':
+        return CSRGraph(self.offsets, self.neighbors_idx, self.labels, weights, dict(self.graph))
+    
+    def _parts(self) -> List[bytes]:
+        # Compact wire/file form: header + raw offsets + raw neighbour indices
+        # (+ 8-byte aligned weights, + length-prefixed JSON labels when they
+        # are not simply 0..n-1, + a JSON object of graph attributes),
+        # little-endian. Nothing in the file is executable, so loading an
+        # untrusted graph file is safe.
+        flags = (_HAS_LABELS if self.labels is not None else 0) | \
+                (_HAS_WEIGHTS if self.weights is not None else 0) | \
+                (_HAS_ATTRS if self.graph else 0)
+        header = _HEADER.pack(_MAGIC, _VERSION, self.number_of_nodes(), len(self.neighbors_idx), flags)
+        parts = [header, bytes(self.offsets), bytes(self.neighbors_idx)]
+        if self.weights is not None:
+            parts.append(bytes(-len(self.neighbors_idx) * 4 % 8))
+            parts.append(bytes(self.weights))
+        if self.labels is not None:
+            parts.append(_encode_json(self.labels))
+        if self.graph:
+            parts.append(_encode_json(self.graph))
+        return parts
+    
+    def to_bytes(self) -> bytes:
+        return b''.join(self._parts())
+    
+    @classmethod
+    def from_bytes(cls, data, copy: bool = True) -> 'CSRGraph':
+        # copy=False keeps memoryview casts over `data` instead of array copies
+        view = memoryview(data)
+        magic, version, n, nnz, flags = _HEADER.unpack_from(view, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Netinkamas CSR grafo formatas")
+        position = _HEADER.size
+        offsets_bytes = view[position:position + (n + 1) * 8]
+        position += (n + 1) * 8
+        neighbors_bytes = view[position:position + nnz * 4]
+        position += nnz * 4
+        weights_bytes = None
+        if flags & _HAS_WEIGHTS:
+            position += -position % 8
+            weights_bytes = view[position:position + nnz * 8]
+            position += nnz * 8
+        labels = None
+        if flags & _HAS_LABELS:
+            labels, position = _decode_json(view, position)
+            labels = [_label_from_json(label) for label in labels]
+        attrs = None
+        if flags & _HAS_ATTRS:
+            attrs, position = _decode_json(view, position)
+            attrs = {key: _label_from_json(value) for key, value in attrs.items()}
+        if copy:
+            offsets, neighbors_idx = array('q'), array('i')
+            offsets.frombytes(offsets_bytes)
+            neighbors_idx.frombytes(neighbors_bytes)
+            weights = None
+            if weights_bytes is not None:
+                weights = array('d')
+                weights.frombytes(weights_bytes)
+        else:
+            offsets, neighbors_idx = offsets_bytes.cast('q'), neighbors_bytes.cast('i')
+            weights = None if weights_bytes is None else weights_bytes.cast('d')
+        return cls(offsets, neighbors_idx, labels, weights, attrs)
+    
+    def save(self, path: str):
+        # Written to a temporary file and renamed, so a reader (or a mapping
+        # of the old file) never sees a half-written graph
+        directory = os.path.dirname(path) or '.'
+        fd, tmp_path = tempfile.mkstemp(prefix='.csr-', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for part in self._parts():
+                    f.write(part)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = True) -> 'CSRGraph':
+        """Load a graph written by save().
+        
+        With ``use_mmap`` the file is memory-mapped read-only and offsets and
+        neighbours are memoryview casts over the mapping: nothing is parsed or
+        copied up front and pages are read in as the search touches them.
+        """
+        with open(path, 'rb') as f:
+            if not use_mmap:
+                return cls.from_bytes(f.read())
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        graph = cls.from_bytes(mapping, copy=False)
+        graph._mmap = mapping
+        return graph
+    
+    def __len__(self) -> int:
+        return self.number_of_nodes()
+    
+    def number_of_nodes(self) -> int:
+        return len(self.offsets) - 1
+    
+    def number_of_edges(self) -> int:
+        return len(self.neighbors_idx) // 2
+    
+    def index_of(self, label) -> int:
+        if self._index is None:
+            if not 0 <= label < self.number_of_nodes():
+                raise KeyError(label)
+            return label
+        return self._index[label]
+    
+    def label_of(self, i: int):
+        return i if self.labels is None else self.labels[i]
+    
+    def neighbors(self, label):
+        i = self.index_of(label)
+        row = self.neighbors_idx[self.offsets[i]:self.offsets[i + 1]]
+        if self.labels is None:
+            return iter(row)
+        return (self.labels[j] for j in row)
+    
+    def nodes(self):
+        return range(self.number_of_nodes()) if self.labels is None else iter(self.labels)
+    
+    def edges(self):
+        # Each undirected edge once, as (label, label) with the smaller index first
+        offsets, nbrs = self.offsets, self.neighbors_idx
+        for i in range(self.number_of_nodes()):
+            for k in range(offsets[i], offsets[i + 1]):
+                if i < nbrs[k]:
+                    yield self.label_of(i), self.label_of(nbrs[k])
+    
+    def edge_weight(self, u, v) -> float:
+        i, j = self.index_of(u), self.index_of(v)
+        low, high = self.offsets[i], self.offsets[i + 1]
+        k = bisect_left(self.neighbors_idx, j, low, high)
+        if k == high or self.neighbors_idx[k] != j:
+            raise KeyError((u, v))
+        return 1.0 if self.weights is None else self.weights[k]
+    
+    def min_weight(self) -> float:
+        # Computed once; the arrays never change
+        if self._min_weight is None:
+            self._min_weight = 1.0 if self.weights is None else min(self.weights, default=1.0)
+        return self._min_weight
+    
+    def path_cost(self, path: List) -> float:
+        return sum(self.edge_weight(u, v) for u, v in zip(path, path[1:]))
+    
+    def to_networkx(self):
+        import networkx as nx
+        
+        n = self.number_of_nodes()
+        labels = range(n) if self.labels is None else self.labels
+        offsets = self.offsets
+        nbrs = self.neighbors_idx
+        graph = nx.Graph(**self.graph)
+        graph.add_nodes_from(labels)
+        if self.weights is None:
+            graph.add_edges_from((labels[i], labels[j]) for i in range(n)
+                                 for j in nbrs[offsets[i]:offsets[i + 1]] if i < j)
+        else:
+            weights = self.weights
+            graph.add_weighted_edges_from((labels[i], labels[nbrs[k]], weights[k]) for i in range(n)
+                                          for k in range(offsets[i], offsets[i + 1]) if i < nbrs[k])
+        return graph
+    
+    def to_labels(self, indices: List[int]) -> List:
+        if self.labels is None:
+            return list(indices)
+        labels = self.labels
+        return [labels[i] for i in indices]
+
+
+def _encode_json(value) -> bytes:
+    try:
+        data = json.dumps(value, separators=(',', ':'), allow_nan=False).encode('utf-8')
+    except (TypeError, ValueError) as error:
+        raise ValueError("CSR faile žymės ir atributai gali būti tik skaičiai, eilutės ir jų kortežai") from error
+    return _LENGTH.pack(len(data)) + data
+
+
+def _decode_json(view: memoryview, position: int):
+    (length,) = _LENGTH.unpack_from(view, position)
+    position += _LENGTH.size
+    end = position + length
+    return json.loads(bytes(view[position:end]).decode('utf-8')), end
+
+
+def _label_from_json(value):
+    # JSON has no tuples; lists can only come from tuples (grid_2d_graph labels, grid_shape)
+    return tuple(_label_from_json(item) for item in value) if isinstance(value, list) else value
+
+
+def _reconstruct_path(parent, start, goal) -> List:
+    # Shared by every search: `parent` maps a node (index or label) to its
+    # parent, as an array or a dict. The walk stops at start, so whatever the
+    # start's own entry holds (itself, -1 or None) is never read.
+    path = [goal]
+    current = goal
+    while current != start:
+        current = parent[current]
+        path.append(current)
+    path.reverse()
+    return path
+
+
+def _record_structures(stats: Optional[dict], peak_frontier: int, visited: int, parent):
+    if stats is not None:
+        stats['peak_frontier'] = peak_frontier
+        stats['peak_visited'] = visited
+        stats['peak_parent'] = len(parent) - parent.count(-1)
+
+
+def csr_dfs(csr: CSRGraph, start: int, goal: int,
+            stats: Optional[dict] = None) -> Tuple[List[int], List[int]]:
+    # Mirrors GraphSearchComparison.dfs step for step (including duplicate
+    # pushes and first-push parents) so paths and visit order are identical.
+    n = csr.number_of_nodes()
+    offsets = csr.offsets
+    nbrs = csr.neighbors_idx
+    visited = bytearray(n)
+    parent = array('i', [-1]) * n
+    parent[start] = start
+    visited_order = []
+    stack = [start]
+    track = stats is not None
+    peak_frontier = 1
+    
+    while stack:
+        node = stack.pop()
+        if visited[node]:
+            continue
+        visited[node] = 1
+        visited_order.append(node)
+        
+        if node == goal:
+            _record_structures(stats, peak_frontier, len(visited_order), parent)
+            return _reconstruct_path(parent, start, goal), visited_order
+        
+        for neighbor in reversed(nbrs[offsets[node]:offsets[node + 1]]):
+            if not visited[neighbor]:
+                if parent[neighbor] == -1:
+                    parent[neighbor] = node
+                stack.append(neighbor)
+        
+        if track and len(stack) > peak_frontier:
+            peak_frontier = len(stack)
+    
+    _record_structures(stats, peak_frontier, len(visited_order), parent)
+    return [], visited_order
+
+
+def csr_bfs(csr: CSRGraph, start: int, goal: int,
+            stats: Optional[dict] = None) -> Tuple[List[int], List[int]]:
+    n = csr.number_of_nodes()
+    offsets = csr.offsets
+    nbrs = csr.neighbors_idx
+    visited = bytearray(n)
+    parent = array('i', [-1]) * n
+    parent[start] = start
+    visited[start] = 1
+    # The visit order doubles as the FIFO queue: BFS dequeues in exactly
+    # the order nodes were first discovered.
+    queue = [start]
+    head = 0
+    track = stats is not None
+    peak_frontier = 1
+    
+    while head < len(queue):
+        node = queue[head]
+        head += 1
+        
+        if node == goal:
+            _record_structures(stats, peak_frontier, len(queue), parent)
+            return _reconstruct_path(parent, start, goal), queue[:head]
+        
+        for neighbor in nbrs[offsets[node]:offsets[node + 1]]:
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                parent[neighbor] = node
+                queue.append(neighbor)
+        
+        if track and len(queue) - head > peak_frontier:
+            peak_frontier = len(queue) - head
+    
+    _record_structures(stats, peak_frontier, len(queue), parent)
+    return [], queue
@@ -0,0 +1,139 @@
+import math
+import os
+import random
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Dict
+
+from .csr_graph import CSRGraph
+from .implicit_graph import grid_neighbors
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+# networkx is imported inside the generators, so listing DATASETS or loading
+# a saved CSR file does not pay for it
+
+
+def assign_random_weights(graph: 'nx.Graph', seed: int = None, low: int = 1, high: int = 10) -> 'nx.Graph':
+    # Integer costs low..high drawn in sorted edge order, so the same graph
+    # and seed always get the same weights
+    rng = random.Random(seed)
+    for u, v in sorted(tuple(sorted(edge)) for edge in graph.edges()):
+        graph[u][v]['weight'] = rng.randint(low, high)
+    return graph
+
+
+def generate_random_graph(num_nodes: int, edge_probability: float = 0.15, seed: int = None,
+                          weighted: bool = False) -> 'nx.Graph':
+    import networkx as nx
+    
+    G = nx.erdos_renyi_graph(num_nodes, edge_probability, seed=seed)
+    
+    # Join the components with one random edge each instead of regenerating
+    # the whole graph until it happens to be connected
+    rng = random.Random(seed)
+    components = [sorted(component) for component in nx.connected_components(G)]
+    for previous, component in zip(components, components[1:]):
+        G.add_edge(rng.choice(previous), rng.choice(component))
+    
+    return assign_random_weights(G, seed) if weighted else G
+
+
+def generate_grid_graph(rows: int, cols: int, weighted: bool = False, seed: int = None) -> 'nx.Graph':
+    import networkx as nx
+    
+    # Built straight from the implicit grid rule with integer labels
+    # r * cols + c, instead of grid_2d_graph followed by a relabel copy
+    neighbors = grid_neighbors(rows, cols)
+    G = nx.Graph()
+    G.add_nodes_from(range(rows * cols))
+    G.add_edges_from((node, neighbor) for node in range(rows * cols)
+                     for neighbor in neighbors(node) if neighbor > node)
+    # Lets astar pick the Manhattan heuristic
+    G.graph['grid_shape'] = (rows, cols)
+    return assign_random_weights(G, seed) if weighted else G
+
+
+def generate_tree_graph(num_nodes: int, branching_factor: int = 3, seed: int = None,
+                        weighted: bool = False) -> 'nx.Graph':
+    import networkx as nx
+    
+    rng = random.Random(seed)
+    G = nx.Graph()
+    G.add_node(0)
+    
+    nodes_to_expand = deque([0])
+    next_node_id = 1
+    
+    while next_node_id < num_nodes and nodes_to_expand:
+        parent = nodes_to_expand.popleft()
+        num_children = min(rng.randint(1, branching_factor), num_nodes - next_node_id)
+        
+        for _ in range(num_children):
+            G.add_edge(parent, next_node_id)
+            nodes_to_expand.append(next_node_id)
+            next_node_id += 1
+            
+            if next_node_id >= num_nodes:
+                break
+    
+    return assign_random_weights(G, seed) if weighted else G
+
+
+def load_or_generate_graph(graph_gen_func, path: str) -> CSRGraph:
+    # First run generates and saves the binary CSR file; every run then
+    # memory-maps it, so repeated runs skip generation and parsing. The path
+    # must identify the generator and all of its parameters (seed included).
+    # A file in an older format is regenerated.
+    if os.path.exists(path):
+        try:
+            return CSRGraph.load(path)
+        except ValueError:
+            pass
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    graph = graph_gen_func()
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx(graph)
+    csr.save(path)
+    return CSRGraph.load(path)
+
+
+DATASETS = [
+    ("1 duomenų rinkinys: Atsitiktinis grafas (25 viršūnės)",
+     lambda: generate_random_graph(25, edge_probability=0.2, seed=42), 0, 24),
+    ("2 duomenų rinkinys: Tinklelio grafas (5x5 = 25 viršūnės)",
+     lambda: generate_grid_graph(5, 5), 0, 24),
+    ("3 duomenų rinkinys: Medžio struktūra (30 viršūnių)",
+     lambda: generate_tree_graph(30, branching_factor=3, seed=123), 0, 29),
+]
+
+
+# Sized generators for benchmark.py and the --sizes option: each takes a
+# target node count and a seed and returns a CSRGraph built with NumPy (loaded
+# on first call). The random graph keeps its expected degree around 2·ln(n)
+# on top of its spanning tree.
+def _random_csr(num_nodes: int, seed: int) -> CSRGraph:
+    from .graph_generators import random_graph_csr
+    return random_graph_csr(num_nodes, edge_probability=min(0.2, 2 * math.log(num_nodes) / num_nodes), seed=seed)
+
+
+def _grid_csr(num_nodes: int, seed: int) -> CSRGraph:
+    from .graph_generators import grid_graph_csr
+    return grid_graph_csr(math.isqrt(num_nodes), math.isqrt(num_nodes))
+
+
+def _tree_csr(num_nodes: int, seed: int) -> CSRGraph:
+    from .graph_generators import tree_graph_csr
+    return tree_graph_csr(num_nodes, branching_factor=3, seed=seed)
+
+
+GENERATORS: Dict[str, Callable[[int, int], CSRGraph]] = {
+    'random': _random_csr,
+    'grid': _grid_csr,
+    'tree': _tree_csr,
+}
+
+GENERATOR_NAMES = {
+    'random': "Atsitiktinis grafas",
+    'grid': "Tinklelio grafas",
+    'tree': "Medžio struktūra",
+}
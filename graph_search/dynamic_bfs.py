@@ -0,0 +1,172 @@
+import heapq
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class IncrementalBFS:
+    """Full BFS tree from one start, repaired in place after edge edits.
+    
+    The tree is kept as in GraphSearchComparison.bfs: ``levels[d]`` lists the
+    nodes at distance ``d`` in dequeue order and ``parent`` is the first
+    neighbour on the previous level (neighbours are scanned in sorted order).
+    After an edit the distances are repaired locally (a BFS for decreases, a
+    Ramalingam-Reps style affected set for increases), then level orders are
+    recomputed from the first level the edit can touch until a level comes
+    out unchanged past the last level whose members moved. Call
+    ``edge_added``/``edge_removed`` after the graph itself has changed.
+    """
+    
+    def __init__(self, neighbors: Callable[[int], Iterable[int]], start: int):
+        self.neighbors = neighbors
+        self.start = start
+        self.dist: Dict[int, int] = {start: 0}
+        self.parent: Dict[int, Optional[int]] = {start: None}
+        self.levels: List[List[int]] = []
+        level = [start]
+        while level:
+            self.levels.append(level)
+            next_level = []
+            for node in level:
+                for neighbor in sorted(neighbors(node)):
+                    if neighbor not in self.dist:
+                        self.dist[neighbor] = len(self.levels)
+                        self.parent[neighbor] = node
+                        next_level.append(neighbor)
+            level = next_level
+    
+    def result(self, goal: int) -> Tuple[List[int], List[int], int]:
+        # (path, visited order, explored) exactly as bfs(start, goal) reports them
+        visited_order = []
+        goal_level = self.dist.get(goal)
+        for depth, level in enumerate(self.levels):
+            if depth == goal_level:
+                visited_order.extend(level[:level.index(goal) + 1])
+                return self.path_to(goal), visited_order, len(visited_order)
+            visited_order.extend(level)
+        return [], visited_order, len(visited_order)
+    
+    def path_to(self, goal: int) -> List[int]:
+        if goal not in self.dist:
+            return []
+        path = []
+        current = goal
+        while current is not None:
+            path.append(current)
+            current = self.parent[current]
+        path.reverse()
+        return path
+    
+    def edge_added(self, u: int, v: int):
+        du, dv = self.dist.get(u), self.dist.get(v)
+        if du is None and dv is None:
+            return
+        if du is None or (dv is not None and dv < du):
+            u, v, du, dv = v, u, dv, du
+        # Now u is the closer endpoint
+        if dv is not None and dv - du <= 1:
+            if dv == du + 1:
+                # v gains a candidate parent; only orders from its level on can move
+                self._rebuild_levels(dv, dv)
+            return
+        
+        moved = {}
+        self.dist[v] = du + 1
+        moved[v] = dv
+        queue = deque([v])
+        while queue:
+            node = queue.popleft()
+            next_depth = self.dist[node] + 1
+            for neighbor in self.neighbors(node):
+                old = self.dist.get(neighbor)
+                if old is None or old > next_depth:
+                    self.dist[neighbor] = next_depth
+                    moved.setdefault(neighbor, old)
+                    queue.append(neighbor)
+        
+        last = max(max(self.dist[node], old if old is not None else 0) for node, old in moved.items())
+        self._rebuild_levels(du + 1, last)
+    
+    def edge_removed(self, u: int, v: int):
+        du, dv = self.dist.get(u), self.dist.get(v)
+        if du is None or dv is None or du == dv:
+            return
+        if du > dv:
+            u, v, du, dv = v, u, dv, du
+        if self.parent[v] != u:
+            # v keeps its earlier parent, so no level order changes
+            return
+        
+        affected = self._affected_by_removal(v)
+        if not affected:
+            self._rebuild_levels(dv, dv)
+            return
+        
+        # Unit-weight Dijkstra over the affected nodes, seeded from the
+        # unaffected nodes around them
+        old_dist = {node: self.dist.pop(node) for node in affected}
+        heap = []
+        for node in affected:
+            best = min((self.dist[nbr] for nbr in self.neighbors(node) if nbr in self.dist), default=None)
+            if best is not None:
+                heap.append((best + 1, node))
+        heapq.heapify(heap)
+        while heap:
+            depth, node = heapq.heappop(heap)
+            if node in self.dist:
+                continue
+            self.dist[node] = depth
+            for neighbor in self.neighbors(node):
+                if neighbor in affected and neighbor not in self.dist:
+                    heapq.heappush(heap, (depth + 1, neighbor))
+        
+        for node in affected:
+            if node not in self.dist:
+                del self.parent[node]
+        last = max(max(old_dist[node], self.dist.get(node, 0)) for node in affected)
+        self._rebuild_levels(dv, last)
+    
+    def _affected_by_removal(self, v: int) -> set:
+        # Nodes whose every neighbour one level up is itself affected; checked
+        # level by level, so all supports of a node are classified first
+        affected = set()
+        checked = {v}
+        queue = deque([v])
+        while queue:
+            node = queue.popleft()
+            depth = self.dist[node]
+            neighbors = list(self.neighbors(node))
+            if any(self.dist.get(nbr) == depth - 1 and nbr not in affected for nbr in neighbors):
+                continue
+            affected.add(node)
+            for neighbor in neighbors:
+                if self.dist.get(neighbor) == depth + 1 and neighbor not in checked:
+                    checked.add(neighbor)
+                    queue.append(neighbor)
+        return affected
+    
+    def _rebuild_levels(self, first: int, last: int):
+        # Recompute levels[first:] and their parents from levels[first - 1],
+        # scanning like bfs; past `last` a level identical to its old order
+        # means every later level is unchanged too
+        depth = first
+        while True:
+            level = []
+            placed = set()
+            for node in self.levels[depth - 1]:
+                for neighbor in sorted(self.neighbors(node)):
+                    if self.dist.get(neighbor) == depth and neighbor not in placed:
+                        placed.add(neighbor)
+                        self.parent[neighbor] = node
+                        level.append(neighbor)
+            
+            old = self.levels[depth] if depth < len(self.levels) else None
+            if not level:
+                del self.levels[depth:]
+                return
+            if old is None:
+                self.levels.append(level)
+            else:
+                self.levels[depth] = level
+                if depth > last and level == old:
+                    return
+            depth += 1
@@ -0,0 +1,104 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from .csr_graph import CSRGraph
+
+
+def _as_numpy(buffer) -> np.ndarray:
+    # Zero-copy view over an array.array / memoryview backed CSR buffer.
+    return np.asarray(memoryview(buffer))
+
+
+def _segment_positions(starts: np.ndarray, lens: np.ndarray) -> np.ndarray:
+    # Flattened indices of the CSR rows [starts[i], starts[i] + lens[i]).
+    total = int(lens.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    shifts = np.repeat(starts - (np.cumsum(lens) - lens), lens)
+    return shifts + np.arange(total, dtype=np.int64)
+
+
+def frontier_bfs(csr: CSRGraph, start: int, goal: int, direction_optimizing: bool = True,
+                 alpha: int = 14, beta: int = 24) -> Tuple[List[int], List[int]]:
+    """Level-synchronous BFS expanding a whole frontier per NumPy step.
+    
+    Each level is ordered by (position of parent in the previous level,
+    node index), which is exactly the order the queue-based ``bfs``
+    discovers nodes in, so path and visit order match it. With
+    ``direction_optimizing`` the search switches to bottom-up steps while
+    the frontier's edge count exceeds the unexplored edges / ``alpha`` and
+    back to top-down once the frontier drops below ``n / beta`` nodes.
+    """
+    n = csr.number_of_nodes()
+    offsets = _as_numpy(csr.offsets).astype(np.int64, copy=False)
+    nbrs = _as_numpy(csr.neighbors_idx)
+    degrees = np.diff(offsets)
+    
+    visited = np.zeros(n, dtype=bool)
+    parent = np.full(n, -1, dtype=np.int64)
+    rank = np.full(n, n, dtype=np.int64)
+    visited[start] = True
+    parent[start] = start
+    
+    frontier = np.array([start], dtype=np.int64)
+    levels = [frontier]
+    unexplored_edges = int(degrees.sum()) - int(degrees[start])
+    bottom_up = False
+    found = start == goal
+    
+    while not found and frontier.size:
+        frontier_edges = int(degrees[frontier].sum())
+        if direction_optimizing:
+            if not bottom_up and frontier_edges > unexplored_edges / alpha:
+                bottom_up = True
+            elif bottom_up and frontier.size < n / beta:
+                bottom_up = False
+        
+        if bottom_up:
+            rank[frontier] = np.arange(frontier.size)
+            candidates = np.flatnonzero(~visited)
+            candidates = candidates[degrees[candidates] > 0]
+            lens = degrees[candidates]
+            ranks = rank[nbrs[_segment_positions(offsets[candidates], lens)]]
+            best = np.minimum.reduceat(ranks, np.cumsum(lens) - lens) if ranks.size else ranks
+            hit = best < n
+            candidates, best = candidates[hit], best[hit]
+            order = np.lexsort((candidates, best))
+            next_level = candidates[order]
+            parent[next_level] = frontier[best[order]]
+            rank[frontier] = n
+        else:
+            lens = degrees[frontier]
+            positions = _segment_positions(offsets[frontier], lens)
+            candidates = nbrs[positions]
+            parents = np.repeat(frontier, lens)
+            fresh = ~visited[candidates]
+            candidates, parents = candidates[fresh], parents[fresh]
+            _, first = np.unique(candidates, return_index=True)
+            first.sort()
+            next_level = candidates[first].astype(np.int64, copy=False)
+            parent[next_level] = parents[first]
+        
+        visited[next_level] = True
+        unexplored_edges -= int(degrees[next_level].sum())
+        
+        if goal >= 0 and visited[goal]:
+            cut = int(np.flatnonzero(next_level == goal)[0]) + 1
+            next_level = next_level[:cut]
+            found = True
+        if next_level.size:
+            levels.append(next_level)
+        frontier = next_level
+    
+    visited_order = np.concatenate(levels).tolist()
+    if not found:
+        return [], visited_order
+    
+    path = [goal]
+    current = goal
+    while current != start:
+        current = int(parent[current])
+        path.append(current)
+    path.reverse()
+    return path, visited_order
@@ -0,0 +1,112 @@
+from array import array
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .csr_graph import CSRGraph
+
+# Generators for large corpora. They work on NumPy edge arrays and emit a
+# CSRGraph directly; call CSRGraph.to_networkx() only when a networkx graph
+# is really needed. Node ids are always 0..n-1.
+
+
+def edges_to_csr(num_nodes: int, src: np.ndarray, dst: np.ndarray) -> CSRGraph:
+    # Symmetrize, drop self-loops and duplicates, sort each row ascending
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    keep = src != dst
+    src, dst = src[keep], dst[keep]
+    
+    keys = np.concatenate((src * num_nodes + dst, dst * num_nodes + src))
+    keys.sort()
+    if keys.size:
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+    rows, cols = np.divmod(keys, num_nodes)
+    
+    offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=num_nodes), out=offsets[1:])
+    
+    offsets_array = array('q')
+    offsets_array.frombytes(offsets.tobytes())
+    neighbors_array = array('i')
+    neighbors_array.frombytes(cols.astype(np.int32).tobytes())
+    return CSRGraph(offsets_array, neighbors_array)
+
+
+def random_edges(num_nodes: int, edge_probability: Optional[float] = None,
+                 average_degree: Optional[float] = None,
+                 seed: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Connected Erdős–Rényi-style edges without regeneration.
+    
+    A random recursive tree (node ``i`` links to a uniform earlier node)
+    guarantees connectivity; on top of it ``Binomial(n(n-1)/2, p)`` uniform
+    random pairs are added. Duplicate pairs are merged later, so the edge
+    count is approximate for dense graphs.
+    """
+    if (edge_probability is None) == (average_degree is None):
+        raise ValueError("Nurodykite edge_probability arba average_degree")
+    if edge_probability is None:
+        edge_probability = min(1.0, average_degree / max(1, num_nodes - 1))
+    
+    rng = np.random.default_rng(seed)
+    tree_dst = np.arange(1, num_nodes, dtype=np.int64)
+    tree_src = (rng.random(num_nodes - 1) * tree_dst).astype(np.int64) if num_nodes > 1 else tree_dst
+    
+    pairs = num_nodes * (num_nodes - 1) // 2
+    extra = int(rng.binomial(pairs, edge_probability)) if pairs else 0
+    extra_src = rng.integers(0, num_nodes, size=extra, dtype=np.int64)
+    extra_dst = rng.integers(0, max(1, num_nodes - 1), size=extra, dtype=np.int64)
+    extra_dst += extra_dst >= extra_src
+    
+    return np.concatenate((tree_src, extra_src)), np.concatenate((tree_dst, extra_dst))
+
+
+def grid_edges(rows: int, cols: int) -> Tuple[np.ndarray, np.ndarray]:
+    # Node (r, c) is r * cols + c, the same labels generate_grid_graph uses
+    ids = np.arange(rows * cols, dtype=np.int64).reshape(rows, cols)
+    horizontal = (ids[:, :-1].ravel(), ids[:, 1:].ravel())
+    vertical = (ids[:-1, :].ravel(), ids[1:, :].ravel())
+    return np.concatenate((horizontal[0], vertical[0])), np.concatenate((horizontal[1], vertical[1]))
+
+
+def tree_edges(num_nodes: int, branching_factor: int = 3,
+               seed: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    # Same shape rule as generate_tree_graph (nodes expanded in id order, each
+    # getting 1..branching_factor children), computed with prefix sums.
+    rng = np.random.default_rng(seed)
+    children = rng.integers(1, branching_factor + 1, size=num_nodes, dtype=np.int64)
+    last_child = np.cumsum(children)
+    child_ids = np.arange(1, num_nodes, dtype=np.int64)
+    parents = np.searchsorted(last_child, child_ids, side='left')
+    return parents, child_ids
+
+
+def random_weights(csr: CSRGraph, low: int = 1, high: int = 10, seed: Optional[int] = None) -> CSRGraph:
+    # One integer cost low..high per undirected edge, written to both
+    # directions of the weights array
+    n = csr.number_of_nodes()
+    offsets = np.asarray(memoryview(csr.offsets))
+    rows = np.repeat(np.arange(n, dtype=np.int64), np.diff(offsets))
+    cols = np.asarray(memoryview(csr.neighbors_idx)).astype(np.int64)
+    keys = np.minimum(rows, cols) * n + np.maximum(rows, cols)
+    edge_keys, edge_ids = np.unique(keys, return_inverse=True)
+    costs = np.random.default_rng(seed).integers(low, high + 1, size=edge_keys.size).astype(np.float64)
+    
+    weights = array('d')
+    weights.frombytes(costs[edge_ids].tobytes())
+    return csr.with_weights(weights)
+
+
+def random_graph_csr(num_nodes: int, edge_probability: Optional[float] = None,
+                     average_degree: Optional[float] = None, seed: Optional[int] = None) -> CSRGraph:
+    return edges_to_csr(num_nodes, *random_edges(num_nodes, edge_probability, average_degree, seed))
+
+
+def grid_graph_csr(rows: int, cols: int) -> CSRGraph:
+    csr = edges_to_csr(rows * cols, *grid_edges(rows, cols))
+    csr.graph['grid_shape'] = (rows, cols)
+    return csr
+
+
+def tree_graph_csr(num_nodes: int, branching_factor: int = 3, seed: Optional[int] = None) -> CSRGraph:
+    return edges_to_csr(num_nodes, *tree_edges(num_nodes, branching_factor, seed))
@@ -0,0 +1,63 @@
+from typing import Callable, Iterable, List, Optional
+
+
+class ImplicitGraph:
+    """Graph given by a neighbour function instead of stored adjacency.
+    
+    Only ``neighbors(node)`` is needed by the searches, so a search over an
+    implicit graph keeps nothing but its own frontier/visited/parent state.
+    ``num_nodes`` is an optional size hint (``None`` for unbounded spaces).
+    """
+    
+    def __init__(self, neighbors_fn: Callable[[int], Iterable[int]], num_nodes: Optional[int] = None):
+        self.neighbors_fn = neighbors_fn
+        self.num_nodes = num_nodes
+    
+    def neighbors(self, node: int) -> Iterable[int]:
+        return iter(self.neighbors_fn(node))
+    
+    def number_of_nodes(self) -> Optional[int]:
+        return self.num_nodes
+    
+    def __contains__(self, node: int) -> bool:
+        return self.num_nodes is None or 0 <= node < self.num_nodes
+
+
+def grid_neighbors(rows: int, cols: int) -> Callable[[int], List[int]]:
+    # Node (r, c) is r * cols + c, as in generate_grid_graph; the result is
+    # already ascending (up, left, right, down).
+    def neighbors(node: int) -> List[int]:
+        row, col = divmod(node, cols)
+        result = []
+        if row > 0:
+            result.append(node - cols)
+        if col > 0:
+            result.append(node - 1)
+        if col < cols - 1:
+            result.append(node + 1)
+        if row < rows - 1:
+            result.append(node + cols)
+        return result
+    return neighbors
+
+
+def tree_neighbors(branching_factor: int, num_nodes: Optional[int] = None) -> Callable[[int], List[int]]:
+    # Complete tree in breadth-first numbering: the parent of i is
+    # (i - 1) // b and its children are b*i + 1 .. b*i + b.
+    def neighbors(node: int) -> List[int]:
+        result = [] if node == 0 else [(node - 1) // branching_factor]
+        first_child = branching_factor * node + 1
+        last_child = first_child + branching_factor
+        if num_nodes is not None:
+            last_child = min(last_child, num_nodes)
+        result.extend(range(first_child, last_child))
+        return result
+    return neighbors
+
+
+def implicit_grid_graph(rows: int, cols: int) -> ImplicitGraph:
+    return ImplicitGraph(grid_neighbors(rows, cols), rows * cols)
+
+
+def implicit_tree_graph(branching_factor: int = 3, num_nodes: Optional[int] = None) -> ImplicitGraph:
+    return ImplicitGraph(tree_neighbors(branching_factor, num_nodes), num_nodes)
@@ -0,0 +1,144 @@
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .csr_graph import CSRGraph, _reconstruct_path
+
+# One traversal from `start` towards many goals (or every node), in CSR index
+# space. Parents and distances live in array('i') vectors of length n with -1
+# for "not reached", instead of a dict per node or a list per goal. A node's
+# parent is final the moment it is first reached (dequeue order in BFS, first
+# push in DFS), so the traversal stops as soon as the last goal is reached.
+
+
+def _goal_flags(n: int, goals: Optional[Iterable[int]]) -> Tuple[bytearray, int]:
+    if goals is None:
+        return bytearray(b'\x01') * n, n
+    pending = bytearray(n)
+    for goal in goals:
+        pending[goal] = 1
+    return pending, pending.count(1)
+
+
+def csr_multi_bfs(csr: CSRGraph, start: int,
+                  goals: Optional[Iterable[int]] = None) -> Tuple[array, array, array]:
+    """BFS until every goal (every node when ``goals`` is None) is reached.
+    
+    Returns ``(parent, distance, expanded order)``; the tree matches the one
+    csr_bfs builds, so each path equals ``csr_bfs(csr, start, goal)``'s.
+    """
+    n = csr.number_of_nodes()
+    offsets = csr.offsets
+    nbrs = csr.neighbors_idx
+    parent = array('i', [-1]) * n
+    distance = array('i', [-1]) * n
+    parent[start] = start
+    distance[start] = 0
+    pending, remaining = _goal_flags(n, goals)
+    if pending[start]:
+        remaining -= 1
+    queue = array('i', [start])
+    head = 0
+    
+    while remaining and head < len(queue):
+        node = queue[head]
+        head += 1
+        depth = distance[node] + 1
+        for neighbor in nbrs[offsets[node]:offsets[node + 1]]:
+            if distance[neighbor] == -1:
+                distance[neighbor] = depth
+                parent[neighbor] = node
+                queue.append(neighbor)
+                if pending[neighbor]:
+                    remaining -= 1
+    
+    return parent, distance, queue[:head]
+
+
+def csr_multi_dfs(csr: CSRGraph, start: int,
+                  goals: Optional[Iterable[int]] = None) -> Tuple[array, array, array]:
+    """DFS until every goal is reached; ``distance`` is the DFS tree depth.
+    
+    Parents are first-push parents as in csr_dfs, so each path equals
+    ``csr_dfs(csr, start, goal)``'s.
+    """
+    n = csr.number_of_nodes()
+    offsets = csr.offsets
+    nbrs = csr.neighbors_idx
+    visited = bytearray(n)
+    parent = array('i', [-1]) * n
+    distance = array('i', [-1]) * n
+    parent[start] = start
+    distance[start] = 0
+    pending, remaining = _goal_flags(n, goals)
+    if pending[start]:
+        remaining -= 1
+    visited_order = array('i')
+    stack = [start]
+    
+    while remaining and stack:
+        node = stack.pop()
+        if visited[node]:
+            continue
+        visited[node] = 1
+        visited_order.append(node)
+        depth = distance[node] + 1
+        for neighbor in reversed(nbrs[offsets[node]:offsets[node + 1]]):
+            if not visited[neighbor]:
+                if parent[neighbor] == -1:
+                    parent[neighbor] = node
+                    distance[neighbor] = depth
+                    if pending[neighbor]:
+                        remaining -= 1
+                stack.append(neighbor)
+    
+    return parent, distance, visited_order
+
+
+class SearchTree:
+    """Parent/distance vectors of one traversal, queried by node label.
+    
+    ``parent``, ``distance`` and ``visited_order`` stay in CSR index space
+    (``csr.index_of``/``csr.label_of`` convert); ``path_to`` and ``paths``
+    return labels. Nodes the traversal did not reach (unreachable, or skipped
+    after the last goal was found) have distance -1 and an empty path.
+    """
+    
+    def __init__(self, csr: CSRGraph, start, parent: array, distance: array, visited_order: array,
+                 exec_time: float = 0.0):
+        self.csr = csr
+        self.start = start
+        self.parent = parent
+        self.distance = distance
+        self.visited_order = visited_order
+        self.exec_time = exec_time
+    
+    @property
+    def nodes_explored(self) -> int:
+        return len(self.visited_order)
+    
+    def _index(self, node) -> Optional[int]:
+        try:
+            return self.csr.index_of(node)
+        except (KeyError, TypeError):
+            return None
+    
+    def reached(self, node) -> bool:
+        i = self._index(node)
+        return i is not None and self.distance[i] != -1
+    
+    def distance_to(self, node) -> int:
+        i = self._index(node)
+        return -1 if i is None else self.distance[i]
+    
+    def path_to(self, node) -> List:
+        i = self._index(node)
+        if i is None or self.distance[i] == -1:
+            return []
+        return self.csr.to_labels(_reconstruct_path(self.parent, self.csr.index_of(self.start), i))
+    
+    def paths(self, goals: Optional[Iterable] = None) -> Dict:
+        # Every reached node when goals is None
+        if goals is None:
+            label_of = self.csr.label_of
+            goals = [label_of(i) for i, depth in enumerate(self.distance) if depth != -1]
+        return {goal: self.path_to(goal) for goal in goals}
@@ -0,0 +1,79 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .csr_graph import CSRGraph
+from .datasets import DATASETS
+from .report import print_comparison_results, print_comparison_table, print_graph_info
+from .search import ALGORITHMS, GraphSearchComparison
+
+# Per-process searchers, filled once by _init_worker from the shipped CSR bytes
+_worker_searchers: Dict[int, GraphSearchComparison] = {}
+
+
+def _load_searchers(payloads: List[Tuple[str, bytes]]) -> Dict[int, GraphSearchComparison]:
+    return {dataset_id: GraphSearchComparison(CSRGraph.from_bytes(data), graph_name, engine='csr')
+            for dataset_id, (graph_name, data) in enumerate(payloads)}
+
+
+def _init_worker(payloads: List[Tuple[str, bytes]]):
+    _worker_searchers.update(_load_searchers(payloads))
+
+
+def _run_job(job: Tuple[int, str, int, int]) -> Tuple[List[int], List[int], float, int]:
+    dataset_id, algorithm, start, goal = job
+    return getattr(_worker_searchers[dataset_id], algorithm)(start, goal)
+
+
+def run_parallel(datasets: Sequence[Tuple[str, Callable, List[Tuple[int, int]]]],
+                 algorithms: Tuple[str, ...] = ('dfs', 'bfs'), max_workers: Optional[int] = None,
+                 verbose: bool = True) -> List[Tuple[str, int, int, Dict[str, tuple]]]:
+    """Run every (dataset, query, algorithm) job on a process pool.
+    
+    ``datasets`` holds ``(graph_name, graph_gen_func, [(start, goal), ...])``.
+    Graphs are generated here, frozen to CSR and sent to each worker once
+    through the pool initializer; jobs only carry ids. Results come back in
+    job order, so the printed tables do not depend on scheduling.
+    """
+    for algorithm in algorithms:
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Nežinomas algoritmas: {algorithm}")
+    
+    graphs = [graph_gen_func() for _, graph_gen_func, _ in datasets]
+    # Generators may already return a CSRGraph (GENERATORS, CSRGraph.load)
+    csrs = [graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx(graph) for graph in graphs]
+    payloads = [(graph_name, csr.to_bytes()) for (graph_name, _, _), csr in zip(datasets, csrs)]
+    jobs = [(dataset_id, algorithm, start, goal)
+            for dataset_id, (_, _, queries) in enumerate(datasets)
+            for start, goal in queries
+            for algorithm in algorithms]
+    
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(payloads,)) as executor:
+        outputs = list(executor.map(_run_job, jobs, chunksize=chunksize))
+    
+    merged = {}
+    for (dataset_id, algorithm, start, goal), output in zip(jobs, outputs):
+        merged.setdefault((dataset_id, start, goal), {})[algorithm] = output
+    
+    results = []
+    for (dataset_id, start, goal), per_algorithm in merged.items():
+        graph_name = datasets[dataset_id][0]
+        results.append((graph_name, start, goal, per_algorithm))
+        if verbose:
+            print_graph_info(graphs[dataset_id], graph_name, start, goal)
+            for algorithm, (path, visited, exec_time, explored) in per_algorithm.items():
+                print_comparison_results(ALGORITHMS[algorithm][1], path, visited, exec_time, explored)
+            print_comparison_table(per_algorithm)
+    return results
+
+
+def main():
+    datasets = [(graph_name, graph_gen_func, [(start_node, goal_node)])
+                for graph_name, graph_gen_func, start_node, goal_node in DATASETS]
+    run_parallel(datasets, algorithms=tuple(ALGORITHMS))
+
+
+if __name__ == "__main__":
+    main()
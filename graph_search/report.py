@@ -0,0 +1,183 @@
+import math
+import os
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from .csr_graph import CSRGraph
+from .datasets import load_or_generate_graph
+from .search import ALGORITHMS, GraphSearchComparison
+from .traversal_stream import summarize_stream
+
+if TYPE_CHECKING:
+    from .visualization import ComparisonRenderer
+
+
+def percentile(samples: Sequence[int], fraction: float) -> int:
+    # Nearest-rank percentile: always one of the samples, no interpolation
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def print_comparison_results(algorithm_name: str, path: List[int], visited: List[int], 
+                            exec_time: float, nodes_explored: int):
+    print(f"\n{'='*60}")
+    print(f"Algoritmas: {algorithm_name}")
+    print(f"{'='*60}")
+    print(f"Rastas kelias: {' -> '.join(map(str, path)) if path else 'Kelias nerastas'}")
+    print(f"Kelio ilgis: {len(path) if path else 0} viršūnių")
+    print(f"Aplankyta viršūnių: {nodes_explored}")
+    print(f"Viršūnių lankymo tvarka: {' -> '.join(map(str, visited[:20]))}" + 
+          (f" ... (ir dar {nodes_explored-20})" if nodes_explored > 20 else ""))
+    print(f"Vykdymo laikas: {exec_time*1000:.4f} ms")
+    print(f"{'='*60}")
+
+
+def print_graph_info(graph, graph_name: str, start_node: int, goal_node: int):
+    print(f"\n\n{'#'*70}")
+    print(f"# {graph_name}")
+    print(f"{'#'*70}")
+    
+    print(f"\nGrafo informacija:")
+    print(f"  - Viršūnių skaičius: {graph.number_of_nodes()}")
+    print(f"  - Briaunų skaičius: {graph.number_of_edges()}")
+    print(f"  - Pradžios viršūnė: {start_node}")
+    print(f"  - Tikslo viršūnė: {goal_node}")
+
+
+def print_comparison_table(results: Dict[str, Tuple[List[int], List[int], float, int]],
+                           memory: Optional[Dict[str, Dict[str, Optional[int]]]] = None,
+                           costs: Optional[Dict[str, float]] = None):
+    names = [ALGORITHMS[algorithm][0] for algorithm in results]
+    rows = list(results.values())
+    width = 30 + 15 * len(rows)
+    
+    print(f"\n{'*'*width}")
+    print(f"PALYGINIMAS")
+    print(f"{'*'*width}")
+    print(f"{'Metrika':<30} | " + " | ".join(f"{name:<12}" for name in names))
+    print(f"{'-'*width}")
+    print(f"{'Kelio ilgis':<30} | " + " | ".join(f"{len(row[0]):<12}" for row in rows))
+    if costs:
+        path_costs = [costs[algorithm] if results[algorithm][0] else None for algorithm in results]
+        print(f"{'Kelio kaina':<30} | " + " | ".join(
+            f"{'-' if cost is None else format(cost, 'g'):<12}" for cost in path_costs))
+    print(f"{'Aplankyta viršūnių':<30} | " + " | ".join(f"{row[3]:<12}" for row in rows))
+    print(f"{'Vykdymo laikas (ms)':<30} | " + " | ".join(f"{row[2]*1000:<12.4f}" for row in rows))
+    
+    if memory:
+        stats = [memory.get(algorithm, {}) for algorithm in results]
+        cell = lambda value: '-' if value is None else value
+        print(f"{'Didžiausias frontas':<30} | " + " | ".join(f"{cell(s.get('peak_frontier')):<12}" for s in stats))
+        print(f"{'Didžiausias visited':<30} | " + " | ".join(f"{cell(s.get('peak_visited')):<12}" for s in stats))
+        print(f"{'Didžiausias parent':<30} | " + " | ".join(f"{cell(s.get('peak_parent')):<12}" for s in stats))
+        print(f"{'Atminties pikas (KB)':<30} | " + " | ".join(
+            f"{s.get('tracemalloc_peak_bytes', 0)/1024:<12.2f}" for s in stats))
+    
+    found = [(name, row) for name, row in zip(names, rows) if row[0]]
+    if len(found) > 1:
+        # Ties go to the later algorithm, as in the original DFS vs BFS summary
+        shortest = min(reversed(found), key=lambda item: len(item[1][0]))
+        fewest = min(reversed(found), key=lambda item: item[1][3])
+        others = [len(row[0]) for name, row in found if name != shortest[0]]
+        print(f"\nIšvada: {shortest[0]} rado trumpiausią kelią "
+              f"({len(shortest[1][0])} vs {', '.join(map(str, others))} viršūnių)")
+        others = [row[3] for name, row in found if name != fewest[0]]
+        print(f"        {fewest[0]} aplankė mažiausiai viršūnių "
+              f"({fewest[1][3]} vs {', '.join(map(str, others))})")
+        if costs:
+            found_costs = [(name, costs[algorithm]) for name, algorithm in zip(names, results)
+                           if results[algorithm][0]]
+            cheapest = min(reversed(found_costs), key=lambda item: item[1])
+            others = [format(cost, 'g') for name, cost in found_costs if name != cheapest[0]]
+            print(f"        {cheapest[0]} rado pigiausią kelią "
+                  f"({cheapest[1]:g} vs {', '.join(others)})")
+    
+    print(f"{'*'*width}")
+
+
+def run_comparison(graph_gen_func, graph_name: str, start_node: int, goal_node: int,
+                   algorithms: Tuple[str, ...] = ('dfs', 'bfs'), measure_memory: bool = True,
+                   render: bool = True, renderer: Optional['ComparisonRenderer'] = None,
+                   data_dir: Optional[str] = None, data_key: Optional[str] = None):
+    # data_key names the saved file; it defaults to graph_name and must
+    # change whenever the generator's parameters do
+    if data_dir is not None:
+        graph_path = os.path.join(data_dir, f"{(data_key or graph_name).replace(' ', '_')}.csr")
+        graph = load_or_generate_graph(graph_gen_func, graph_path)
+    else:
+        graph = graph_gen_func()
+    print_graph_info(graph, graph_name, start_node, goal_node)
+    
+    engine = 'csr' if isinstance(graph, CSRGraph) else 'networkx'
+    searcher = GraphSearchComparison(graph, graph_name, engine=engine)
+    
+    # Without a figure or a memory run only the printed 20-node prefix of the
+    # visit order is needed, so networkx dfs/bfs are drained from their visit
+    # streams instead of building the whole order. The CSR kernels are
+    # several times faster than the streams, so they always run as they are.
+    stream = not render and not measure_memory and engine == 'networkx'
+    streams = {'dfs': searcher.iter_dfs, 'bfs': searcher.iter_bfs} if stream else {}
+    results = {}
+    for algorithm in algorithms:
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Nežinomas algoritmas: {algorithm}")
+        if algorithm in streams:
+            path, visited, exec_time, explored = summarize_stream(streams[algorithm](start_node, goal_node))
+        else:
+            path, visited, exec_time, explored = getattr(searcher, algorithm)(start_node, goal_node)
+        print_comparison_results(ALGORITHMS[algorithm][1], path, visited, exec_time, explored)
+        results[algorithm] = (path, visited, exec_time, explored)
+    
+    # Memory is measured in a separate run so tracemalloc does not skew the timings
+    memory = {}
+    if measure_memory:
+        for algorithm in algorithms:
+            memory[algorithm] = searcher.measure_memory(algorithm, start_node, goal_node)
+    
+    costs = {algorithm: searcher.path_cost(result[0]) for algorithm, result in results.items()} \
+        if searcher.is_weighted() else None
+    print_comparison_table(results, memory, costs)
+    
+    if render:
+        if renderer is None:
+            from .visualization import ComparisonRenderer  # matplotlib only when drawing
+            renderer = ComparisonRenderer()
+        titles = {algorithm: ALGORITHMS[algorithm][0] for algorithm in results}
+        output = renderer.render(graph, graph_name, start_node, goal_node, results, titles)
+        if isinstance(output, str):
+            print(f"\nGrafų vizualizacija išsaugota: {output}")
+    
+    return graph, results, memory
+
+
+def print_header():
+    print("="*70)
+    print(" "*15 + "NEINFORMUOTOS PAIEŠKOS ALGORITMŲ PALYGINIMAS")
+    print(" "*20 + "DFS (Depth First Search) vs BFS (Breadth First Search)")
+    print("="*70)
+
+
+def print_conclusion():
+    print(f"\n\n{'='*70}")
+    print(" "*20 + "BENDRA IŠVADA")
+    print("="*70)
+    print("""
+BREADTH FIRST SEARCH (BFS):
+  + Visada randa trumpiausią kelią (optimalus nesvertiniuose grafuose)
+  + Gerai tinka, kai sprendimas yra arti pradžios viršūnės
+  - Naudoja daugiau atminties (saugo visą lygį eilėje)
+  - Gali aplankyti daugiau viršūnių nei reikia
+  
+DEPTH FIRST SEARCH (DFS):
+  + Naudoja mažiau atminties (tik dėklo gylis)
+  + Greičiau randa sprendimą, kai jis yra giliai grafui
+  - Negarantuoja trumpiausio kelio
+  - Gali įstrigti giliuose šakose prieš randant sprendimą
+  
+BENDROS PASTABOS:
+  • BFS yra geresnis pasirinkimas, kai reikia rasti trumpiausią kelią
+  • DFS yra geresnis, kai grafo gilumo riboti arba kai atmintis ribota
+  • Abu algoritmai turi O(V + E) laiko sudėtingumą, kur V - viršūnės, E - briaunos
+  • BFS erdvės sudėtingumas O(V), DFS - O(h), kur h - maksimalus gylis
+    """)
+    print("="*70)
@@ -0,0 +1,622 @@
+import itertools
+import sys
+import time
+import tracemalloc
+from array import array
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Iterable, List, NamedTuple, Tuple, Dict, Set, Optional
+
+from .compact_search import compact_bfs, compact_dfs
+from .components import ComponentIndex
+from .csr_graph import CSRGraph, _reconstruct_path, csr_bfs, csr_dfs
+from .dynamic_bfs import IncrementalBFS
+from .implicit_graph import ImplicitGraph
+from .multi_goal import SearchTree, csr_multi_bfs, csr_multi_dfs
+from .search_cache import SearchCache
+from .search_profiler import SearchProfiler, profiled_bfs, profiled_dfs
+from .traversal_stream import VisitStream, iter_bfs, iter_dfs
+from .weighted_search import csr_astar, manhattan_heuristic
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+# Cache keys start with a per-searcher token: id(graph) can be reused once a
+# graph is garbage-collected, which would mix graphs in a shared SearchCache
+_searcher_tokens = itertools.count()
+
+
+class DepthLimitedResult(NamedTuple):
+    path: List[int]
+    visited_order: List[int]
+    exec_time: float
+    nodes_explored: int
+    status: str  # 'found', 'cutoff' or 'failure'
+    depth_counts: List[int]  # nodes visited at each depth 0..limit
+
+
+class GraphSearchComparison:
+    def __init__(self, graph: 'nx.Graph', name: str, engine: str = 'networkx',
+                 cache: Optional[SearchCache] = None, track_memory: bool = False,
+                 num_nodes: Optional[int] = None, compact: bool = False,
+                 heuristic: Optional[Callable[[int, int], float]] = None, incremental: bool = False,
+                 skip_unreachable: bool = False, profiler: Optional[SearchProfiler] = None):
+        if engine not in ('networkx', 'csr'):
+            raise ValueError(f"Nežinomas variklis: {engine}")
+        # A bare neighbour callable is searched as an implicit graph
+        if callable(graph) and not hasattr(graph, 'neighbors'):
+            graph = ImplicitGraph(graph, num_nodes)
+        if engine == 'csr' and isinstance(graph, ImplicitGraph):
+            raise ValueError("Netiesioginio grafo negalima paversti CSR")
+        self.graph = graph
+        self.name = name
+        self.engine = engine
+        self.cache = cache if cache is not None else SearchCache()
+        self.track_memory = track_memory
+        self.compact = compact
+        self.heuristic = heuristic
+        # With incremental=True, bfs keeps one full BFS tree per start and
+        # add_edge/remove_edge repair them instead of discarding them
+        self.incremental = incremental
+        self._dynamic: Dict[int, IncrementalBFS] = {}
+        # With skip_unreachable=True, dfs/bfs/batch_search answer queries
+        # between different components at once (empty order, 0 explored)
+        self.skip_unreachable = skip_unreachable
+        self._components = None
+        # With a profiler set, dfs/bfs run the instrumented loops of
+        # search_profiler instead (checked once per call)
+        self.profiler = profiler
+        self._dense_labels = None
+        self.last_stats = {}
+        self._csr = None
+        self._token = next(_searcher_tokens)
+        self._version = 0
+        
+    @property
+    def csr(self) -> CSRGraph:
+        if self._csr is None:
+            if isinstance(self.graph, CSRGraph):
+                self._csr = self.graph
+            else:
+                self._csr = CSRGraph.from_networkx(self.graph)
+        return self._csr
+    
+    def has_dense_labels(self) -> bool:
+        # True when the nodes are exactly the integers 0..n-1 (checked once)
+        if self._dense_labels is None:
+            graph = self.graph
+            num_nodes = graph.number_of_nodes()
+            if isinstance(graph, ImplicitGraph):
+                self._dense_labels = num_nodes is not None
+            elif isinstance(graph, CSRGraph):
+                self._dense_labels = graph.labels is None
+            else:
+                self._dense_labels = all(type(node) is int and 0 <= node < num_nodes for node in graph)
+        return self._dense_labels
+    
+    @property
+    def components(self) -> ComponentIndex:
+        # Built on first use; add_edge keeps it current, remove_edge drops it
+        if self._components is None:
+            self._components = ComponentIndex(self.graph.nodes(), self.graph.edges())
+        return self._components
+    
+    def connected(self, u: int, v: int) -> bool:
+        if isinstance(self.graph, ImplicitGraph):
+            return True  # unknown without a full traversal
+        return self.components.connected(u, v)
+    
+    def fingerprint(self) -> Tuple[int, int, int]:
+        # Bumped by add_edge/remove_edge/invalidate. The node count only notices
+        # added or removed nodes; edge edits made directly on self.graph change
+        # nothing here, so they need invalidate().
+        return self._token, self._version, self.graph.number_of_nodes()
+    
+    def invalidate(self):
+        # For direct edits of self.graph, which cannot be repaired incrementally
+        self._dynamic = {}
+        self._components = None
+        self._graph_changed()
+    
+    def _graph_changed(self):
+        token = self._token
+        self._version += 1
+        self._csr = None
+        self._dense_labels = None
+        self.cache.invalidate(lambda key: key[0][0] == token)
+    
+    def add_edge(self, u: int, v: int):
+        self.graph.add_edge(u, v)
+        for tree in self._dynamic.values():
+            tree.edge_added(u, v)
+        if self._components is not None:
+            self._components.union(u, v)
+        self._graph_changed()
+    
+    def remove_edge(self, u: int, v: int):
+        self.graph.remove_edge(u, v)
+        for tree in self._dynamic.values():
+            tree.edge_removed(u, v)
+        self._components = None
+        self._graph_changed()
+    
+    def search(self, algorithm: str, start: int, goal: int) -> Tuple[List[int], List[int], float, int]:
+        """Memoized entry point; the time reported on a hit is the lookup time.
+        
+        Results stay valid while the graph is changed only through
+        ``add_edge``/``remove_edge``. After editing ``self.graph`` directly
+        (e.g. ``G.add_edge``), call ``invalidate()``: the cache, the CSR copy
+        and the component index cannot see such edits and would keep
+        answering for the old graph.
+        """
+        start_time = time.perf_counter()
+        fingerprint = self.fingerprint()
+        key = (fingerprint, algorithm, start, goal)
+        tree_key = (fingerprint, 'bfs_tree', start, None)
+        # A bfs answered from a stored tree counts as one hit (on the tree)
+        if algorithm == 'bfs' and key not in self.cache and tree_key in self.cache:
+            cached = self._bfs_result_from_tree(self.cache.get(tree_key), start, goal)
+            self.cache.put(key, cached)
+        else:
+            cached = self.cache.get(key)
+        
+        if cached is not None:
+            path, visited_order, _, explored = cached
+            end_time = time.perf_counter()
+            return list(path), list(visited_order), end_time - start_time, explored
+        
+        result = getattr(self, algorithm)(start, goal)
+        self.cache.put(key, result)
+        # Copies, so callers cannot change the cached lists
+        path, visited_order, exec_time, explored = result
+        return list(path), list(visited_order), exec_time, explored
+    
+    def dfs(self, start: int, goal: int) -> Tuple[List[int], List[int], float, int]:
+        if self.skip_unreachable and not self.connected(start, goal):
+            return [], [], 0.0, 0
+        if self.profiler is not None:
+            return self._profiled_search(profiled_dfs, start, goal)
+        track = self.track_memory
+        if self.engine == 'csr':
+            stats = self._new_stats() if track else None
+            return self._csr_search(lambda csr, s, g: csr_dfs(csr, s, g, stats), start, goal)
+        if self.compact and self.has_dense_labels():
+            return self._compact_search(compact_dfs, start, goal)
+        start_time = time.perf_counter()
+        visited = set()
+        visited_order = []
+        parent = {start: None}
+        stack = [start]
+        peak_frontier = 1
+        
+        while stack:
+            node = stack.pop()
+            
+            if node not in visited:
+                visited.add(node)
+                visited_order.append(node)
+                
+                if node == goal:
+                    path = _reconstruct_path(parent, start, goal)
+                    end_time = time.perf_counter()
+                    if track:
+                        self._record_structures(peak_frontier, len(visited), len(parent))
+                    return path, visited_order, end_time - start_time, len(visited_order)
+                
+                neighbors = list(self.graph.neighbors(node))
+                neighbors.sort(reverse=True)
+                
+                for neighbor in neighbors:
+                    if neighbor not in visited:
+                        if neighbor not in parent:
+                            parent[neighbor] = node
+                        stack.append(neighbor)
+                
+                # The stack can hold the same node several times, so its peak
+                # may exceed both the depth and the number of nodes
+                if track and len(stack) > peak_frontier:
+                    peak_frontier = len(stack)
+        
+        end_time = time.perf_counter()
+        if track:
+            self._record_structures(peak_frontier, len(visited), len(parent))
+        return [], visited_order, end_time - start_time, len(visited_order)
+    
+    def bfs(self, start: int, goal: int) -> Tuple[List[int], List[int], float, int]:
+        if self.skip_unreachable and not self.connected(start, goal):
+            return [], [], 0.0, 0
+        if self.profiler is not None:
+            return self._profiled_search(profiled_bfs, start, goal)
+        if self.incremental:
+            return self._incremental_bfs(start, goal)
+        track = self.track_memory
+        if self.engine == 'csr':
+            stats = self._new_stats() if track else None
+            return self._csr_search(lambda csr, s, g: csr_bfs(csr, s, g, stats), start, goal)
+        if self.compact and self.has_dense_labels():
+            return self._compact_search(compact_bfs, start, goal)
+        start_time = time.perf_counter()
+        visited = set()
+        visited_order = []
+        parent = {start: None}
+        queue = deque([start])
+        visited.add(start)
+        peak_frontier = 1
+        
+        while queue:
+            node = queue.popleft()
+            visited_order.append(node)
+            
+            if node == goal:
+                path = _reconstruct_path(parent, start, goal)
+                end_time = time.perf_counter()
+                if track:
+                    self._record_structures(peak_frontier, len(visited), len(parent))
+                return path, visited_order, end_time - start_time, len(visited_order)
+            
+            neighbors = sorted(list(self.graph.neighbors(node)))
+            
+            for neighbor in neighbors:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    parent[neighbor] = node
+                    queue.append(neighbor)
+            
+            if track and len(queue) > peak_frontier:
+                peak_frontier = len(queue)
+        
+        end_time = time.perf_counter()
+        if track:
+            self._record_structures(peak_frontier, len(visited), len(parent))
+        return [], visited_order, end_time - start_time, len(visited_order)
+    
+    def iter_dfs(self, start: int, goal: Optional[int] = None,
+                 max_visits: Optional[int] = None) -> VisitStream:
+        # Lazy dfs: yields VisitEvent(node, depth, parent) in dfs visit order
+        return iter_dfs(self.graph.neighbors, start, goal, max_visits)
+    
+    def iter_bfs(self, start: int, goal: Optional[int] = None,
+                 max_visits: Optional[int] = None) -> VisitStream:
+        return iter_bfs(self.graph.neighbors, start, goal, max_visits)
+    
+    def bfs_frontier(self, start: int, goal: int,
+                     direction_optimizing: bool = True) -> Tuple[List[int], List[int], float, int]:
+        from .frontier_bfs import frontier_bfs  # NumPy is loaded on first use
+        search_func = lambda csr, s, g: frontier_bfs(csr, s, g, direction_optimizing)
+        return self._csr_search(search_func, start, goal)
+    
+    def bidirectional_bfs(self, start: int, goal: int) -> Tuple[List[int], List[int], float, int]:
+        start_time = time.perf_counter()
+        visited_order = []
+        
+        if start == goal:
+            visited_order.append(start)
+            end_time = time.perf_counter()
+            return [start], visited_order, end_time - start_time, len(visited_order)
+        
+        parent_forward = {start: None}
+        parent_backward = {goal: None}
+        frontier_forward = [start]
+        frontier_backward = [goal]
+        
+        while frontier_forward and frontier_backward:
+            # Always grow the smaller side by one full level
+            if len(frontier_forward) <= len(frontier_backward):
+                frontier, parents, other = frontier_forward, parent_forward, parent_backward
+            else:
+                frontier, parents, other = frontier_backward, parent_backward, parent_forward
+            
+            next_frontier = []
+            for node in frontier:
+                visited_order.append(node)
+                
+                for neighbor in sorted(self.graph.neighbors(node)):
+                    if neighbor in parents:
+                        continue
+                    parents[neighbor] = node
+                    
+                    if neighbor in other:
+                        path = _reconstruct_path(parent_forward, start, neighbor)
+                        backward = _reconstruct_path(parent_backward, goal, neighbor)
+                        path.extend(reversed(backward[:-1]))
+                        end_time = time.perf_counter()
+                        return path, visited_order, end_time - start_time, len(visited_order)
+                    
+                    next_frontier.append(neighbor)
+            
+            if frontier is frontier_forward:
+                frontier_forward = next_frontier
+            else:
+                frontier_backward = next_frontier
+        
+        end_time = time.perf_counter()
+        return [], visited_order, end_time - start_time, len(visited_order)
+    
+    def depth_limited_search(self, start: int, goal: int, limit: int) -> DepthLimitedResult:
+        if limit < 0:
+            raise ValueError(f"Gylio riba turi būti neneigiama, ne {limit}")
+        start_time = time.perf_counter()
+        visited_order = []
+        depth_counts = [0] * (limit + 1)
+        path, status = self._depth_limited_search(start, goal, limit, visited_order, depth_counts)
+        end_time = time.perf_counter()
+        return DepthLimitedResult(path, visited_order, end_time - start_time, len(visited_order),
+                                  status, depth_counts)
+    
+    def ids(self, start: int, goal: int, max_depth: Optional[int] = None) -> Tuple[List[int], List[int], float, int]:
+        start_time = time.perf_counter()
+        visited_order = []
+        limit = 0
+        
+        while max_depth is None or limit <= max_depth:
+            path, status = self._depth_limited_search(start, goal, limit, visited_order, [0] * (limit + 1))
+            if status != 'cutoff':
+                end_time = time.perf_counter()
+                return path, visited_order, end_time - start_time, len(visited_order)
+            limit += 1
+        
+        end_time = time.perf_counter()
+        return [], visited_order, end_time - start_time, len(visited_order)
+    
+    def _depth_limited_search(self, start: int, goal: int, limit: int, visited_order: List[int],
+                              depth_counts: List[int]) -> Tuple[List[int], str]:
+        # DFS bounded by `limit` on an explicit stack of (node, depth, neighbour
+        # iterator) frames, so depth is not tied to Python's recursion limit and
+        # neighbours are taken one at a time instead of all pushed up front. The
+        # frames on the stack are the current path. A node is re-expanded only
+        # when it is reached at a smaller depth than before, so nothing within
+        # the limit is missed; the first hit is not necessarily a shortest path
+        # (ids gets those by raising the limit one step at a time). Status is
+        # 'found', 'cutoff' (the limit pruned something) or 'failure' (nothing
+        # left to find).
+        visited_order.append(start)
+        depth_counts[0] += 1
+        if start == goal:
+            return [start], 'found'
+        if limit == 0:
+            has_neighbors = next(iter(self.graph.neighbors(start)), None) is not None
+            return [], 'cutoff' if has_neighbors else 'failure'
+        
+        best_depth = {start: 0}
+        stack = [(start, 0, iter(sorted(self.graph.neighbors(start))))]
+        
+        while stack:
+            _, depth, neighbors = stack[-1]
+            neighbor = next(neighbors, None)
+            if neighbor is None:
+                stack.pop()
+                continue
+            
+            depth += 1
+            if best_depth.get(neighbor, limit + 1) <= depth:
+                continue
+            best_depth[neighbor] = depth
+            visited_order.append(neighbor)
+            depth_counts[depth] += 1
+            
+            if neighbor == goal:
+                return [frame[0] for frame in stack] + [neighbor], 'found'
+            
+            if depth < limit:
+                stack.append((neighbor, depth, iter(sorted(self.graph.neighbors(neighbor)))))
+        
+        # best_depth now holds the true depth of everything within the limit.
+        # Something was pruned only if a node at the limit has a neighbour that
+        # was never reached, as in the limit == 0 case above.
+        cutoff = any(nbr not in best_depth for node, depth in best_depth.items() if depth == limit
+                     for nbr in self.graph.neighbors(node))
+        return [], 'cutoff' if cutoff else 'failure'
+    
+    def ucs(self, start: int, goal: int) -> Tuple[List[int], List[int], float, int]:
+        # Uniform-cost search (Dijkstra); visited order is the settle order
+        return self._weighted_search(start, goal, None)
+    
+    def astar(self, start: int, goal: int) -> Tuple[List[int], List[int], float, int]:
+        # heuristic(node, goal) from the constructor, or Manhattan distance on
+        # grids (generate_grid_graph, grid_graph_csr or a CSRGraph converted
+        # or loaded from one) whose edges all cost at least 1, where it never
+        # overestimates; with neither it matches ucs
+        heuristic = self.heuristic
+        grid_shape = getattr(self.graph, 'graph', {}).get('grid_shape')
+        if heuristic is None and grid_shape is not None and self.csr.min_weight() >= 1:
+            heuristic = manhattan_heuristic(grid_shape[1])
+        return self._weighted_search(start, goal, heuristic)
+    
+    def is_weighted(self) -> bool:
+        return not isinstance(self.graph, ImplicitGraph) and self.csr.weights is not None
+    
+    def path_cost(self, path: List[int]) -> float:
+        if isinstance(self.graph, ImplicitGraph):
+            return float(max(0, len(path) - 1))
+        return self.csr.path_cost(path)
+    
+    def multi_goal_search(self, start: int, goals: Optional[Iterable[int]] = None,
+                          algorithm: str = 'bfs') -> SearchTree:
+        # One bfs/dfs traversal from start that stops once every goal (every
+        # node with goals=None) is reached; tree.path_to(goal) is the path
+        # bfs/dfs(start, goal) returns. Goals that are not nodes are ignored.
+        kernels = {'bfs': csr_multi_bfs, 'dfs': csr_multi_dfs}
+        if algorithm not in kernels:
+            raise ValueError(f"Kelių tikslų paieška palaiko tik bfs ir dfs, ne {algorithm}")
+        if isinstance(self.graph, ImplicitGraph):
+            raise ValueError("Kelių tikslų paieška netiesioginiame grafe nepalaikoma")
+        csr = self.csr
+        index_goals = None
+        if goals is not None:
+            index_goals = []
+            for goal in goals:
+                try:
+                    index_goals.append(csr.index_of(goal))
+                except (KeyError, TypeError):
+                    continue
+        start_time = time.perf_counter()
+        parent, distance, visited_order = kernels[algorithm](csr, csr.index_of(start), index_goals)
+        end_time = time.perf_counter()
+        return SearchTree(csr, start, parent, distance, visited_order, end_time - start_time)
+    
+    def batch_search(self, queries: List[Tuple[int, int]]) -> List[List[int]]:
+        # One BFS tree per distinct start answers all of its goals; trees are
+        # kept in self.cache so later batches only rebuild paths. Implicit
+        # graphs have no CSR form (and may be unbounded), so they run bfs per query.
+        goals_by_start = {}
+        for i, (start, goal) in enumerate(queries):
+            if self.skip_unreachable and not self.connected(start, goal):
+                continue
+            goals_by_start.setdefault(start, []).append(i)
+        
+        paths = [[] for _ in queries]
+        for start, indices in goals_by_start.items():
+            if self.incremental:
+                tree = self._incremental_tree(start)
+                for i in indices:
+                    paths[i] = tree.path_to(queries[i][1])
+                continue
+            if isinstance(self.graph, ImplicitGraph):
+                for i in indices:
+                    paths[i] = self.bfs(start, queries[i][1])[0]
+                continue
+            tree = self._bfs_tree(start)
+            for i in indices:
+                paths[i] = tree.path_to(queries[i][1])
+        return paths
+    
+    def _incremental_tree(self, start: int) -> IncrementalBFS:
+        tree = self._dynamic.get(start)
+        if tree is None:
+            tree = self._dynamic[start] = IncrementalBFS(self.graph.neighbors, start)
+        return tree
+    
+    def _incremental_bfs(self, start: int, goal: int) -> Tuple[List[int], List[int], float, int]:
+        start_time = time.perf_counter()
+        path, visited_order, explored = self._incremental_tree(start).result(goal)
+        end_time = time.perf_counter()
+        return path, visited_order, end_time - start_time, explored
+    
+    def _bfs_tree(self, start: int) -> SearchTree:
+        key = (self.fingerprint(), 'bfs_tree', start, None)
+        tree = self.cache.get(key)
+        if tree is not None:
+            return tree
+        
+        # Full BFS as array('i') vectors over self.csr: 12 bytes per node, so a
+        # 10^6-node tree fits the default cache budget (a parent dict does not)
+        tree = self.multi_goal_search(start)
+        # The traversal stops once the last node is discovered; bfs's order
+        # goes on through the unexpanded tail in queue order (the parent's
+        # position, then ascending index), so append that for search()
+        order, parent = tree.visited_order, tree.parent
+        rank = array('i', [-1]) * len(parent)
+        for position, i in enumerate(order):
+            rank[i] = position
+        tail = [i for i, depth in enumerate(tree.distance) if depth != -1 and rank[i] == -1]
+        tail.sort(key=lambda i: (rank[parent[i]], i))
+        order.extend(tail)
+        size = sum(sys.getsizeof(vector) for vector in (tree.parent, tree.distance, tree.visited_order))
+        self.cache.put(key, tree, size)
+        return tree
+    
+    def _bfs_result_from_tree(self, tree: SearchTree, start: int,
+                              goal: int) -> Tuple[List[int], List[int], float, int]:
+        # The tree's expansion order is bfs's dequeue order, so bfs's visit
+        # order is the prefix of it ending at the goal.
+        csr = tree.csr
+        visited_order = tree.visited_order
+        if tree.reached(goal):
+            visited_order = visited_order[:visited_order.index(csr.index_of(goal)) + 1]
+        return tree.path_to(goal), csr.to_labels(visited_order), 0.0, len(visited_order)
+    
+    def measure_memory(self, algorithm: str, start: int, goal: int) -> Dict[str, Optional[int]]:
+        # One extra run with tracemalloc on; frontier/visited/parent peaks are
+        # recorded by algorithms that track them (None for the others).
+        previous = self.track_memory
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        self.track_memory = True
+        self._new_stats()
+        try:
+            getattr(self, algorithm)(start, goal)
+            peak_bytes = tracemalloc.get_traced_memory()[1] - baseline
+        finally:
+            self.track_memory = previous
+            if not was_tracing:
+                tracemalloc.stop()
+        
+        stats = {'peak_frontier': None, 'peak_visited': None, 'peak_parent': None}
+        stats.update(self.last_stats)
+        stats['tracemalloc_peak_bytes'] = peak_bytes
+        self.last_stats = stats
+        return stats
+    
+    def profile(self, algorithm: str, start: int, goal: int, trace: bool = False) -> SearchProfiler:
+        # One extra run of dfs or bfs with a fresh profiler; the counters,
+        # phase times and (with trace=True) the event trace are returned
+        if algorithm not in ('dfs', 'bfs'):
+            raise ValueError(f"Profiliuoti galima tik dfs ir bfs, ne {algorithm}")
+        previous = self.profiler
+        self.profiler = SearchProfiler(trace=trace)
+        try:
+            getattr(self, algorithm)(start, goal)
+            return self.profiler
+        finally:
+            self.profiler = previous
+    
+    def _profiled_search(self, search_func, start: int, goal: int) -> Tuple[List[int], List[int], float, int]:
+        profiler = self.profiler
+        start_ns = time.perf_counter_ns()
+        path, visited_order = search_func(self.graph, start, goal, profiler)
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        profiler.total_ns += elapsed_ns
+        return path, visited_order, elapsed_ns / 1e9, len(visited_order)
+    
+    def _new_stats(self) -> Dict[str, int]:
+        self.last_stats = {}
+        return self.last_stats
+    
+    def _record_structures(self, peak_frontier: int, visited: int, parent: int):
+        self.last_stats = {'peak_frontier': peak_frontier, 'peak_visited': visited, 'peak_parent': parent}
+    
+    def _compact_search(self, search_func, start: int, goal: int) -> Tuple[List[int], List[int], float, int]:
+        stats = self._new_stats() if self.track_memory else None
+        graph = self.graph
+        neighbors = lambda node: sorted(graph.neighbors(node))
+        start_time = time.perf_counter()
+        path, visited_order = search_func(neighbors, graph.number_of_nodes(), start, goal, stats)
+        end_time = time.perf_counter()
+        return path, visited_order, end_time - start_time, len(visited_order)
+    
+    def _weighted_search(self, start: int, goal: int,
+                         heuristic: Optional[Callable[[int, int], float]]) -> Tuple[List[int], List[int], float, int]:
+        if isinstance(self.graph, ImplicitGraph):
+            raise ValueError("Svertinė paieška netiesioginiame grafe nepalaikoma")
+        stats = self._new_stats() if self.track_memory else None
+        index_heuristic = None
+        if heuristic is not None:
+            label_of = self.csr.label_of
+            index_heuristic = lambda i: heuristic(label_of(i), goal)
+        search_func = lambda csr, s, g: csr_astar(csr, s, g, index_heuristic, stats)[:2]
+        return self._csr_search(search_func, start, goal)
+    
+    def _csr_search(self, search_func, start: int, goal: int) -> Tuple[List[int], List[int], float, int]:
+        csr = self.csr
+        try:
+            goal_index = csr.index_of(goal)
+        except (KeyError, TypeError):
+            goal_index = -1  # never reached, like a missing goal on the networkx engine
+        start_time = time.perf_counter()
+        path, visited_order = search_func(csr, csr.index_of(start), goal_index)
+        end_time = time.perf_counter()
+        return csr.to_labels(path), csr.to_labels(visited_order), end_time - start_time, len(visited_order)
+
+
+ALGORITHMS = {
+    'dfs': ('DFS', 'DFS (Depth First Search)'),
+    'bfs': ('BFS', 'BFS (Breadth First Search)'),
+    'bfs_frontier': ('BFS-front', 'BFS (lygiais sinchronizuota)'),
+    'bidirectional_bfs': ('BIDIR', 'Bidirectional Search'),
+    'ids': ('IDS', 'IDS (Iterative Deepening Search)'),
+    'ucs': ('UCS', 'UCS (Uniform Cost Search)'),
+    'astar': ('A*', 'A* (A-star Search)'),
+}
+
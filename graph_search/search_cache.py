@@ -0,0 +1,82 @@
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+def estimate_size(value: Any) -> int:
+    # Rough deep size in bytes for the containers the searches return
+    # (tuples/lists of node ids and parent dicts); good enough for budgeting.
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(estimate_size(item) if isinstance(item, (list, tuple, dict))
+                    else sys.getsizeof(item) for item in value)
+    return size
+
+
+class SearchCache:
+    """LRU cache of search results bounded by entry count and byte budget.
+    
+    Keys are ``(graph fingerprint, algorithm, start, goal)`` tuples; values
+    are stored as-is together with their estimated size. Values larger than
+    the whole budget are not stored.
+    """
+    
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+    
+    def put(self, key: Hashable, value: Any, size: Optional[int] = None):
+        if size is None:
+            size = estimate_size(value)
+        if key in self._entries:
+            self.current_bytes -= self._entries.pop(key)[1]
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+        
+        self._entries[key] = (value, size)
+        self.current_bytes += size
+        while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self.evictions += 1
+    
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None):
+        if predicate is None:
+            self._entries.clear()
+            self.current_bytes = 0
+            return
+        for key in [key for key in self._entries if predicate(key)]:
+            self.current_bytes -= self._entries.pop(key)[1]
+    
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,172 @@
+import json
+import time
+from array import array
+from collections import deque
+from typing import Dict, List, Tuple
+
+from .csr_graph import _reconstruct_path
+
+# Instrumented copies of the dict/set loops of GraphSearchComparison.dfs and
+# bfs. The searcher checks for a profiler once per call and only then runs
+# these, so the normal loops carry no profiling code at all.
+
+PHASES = ('neighbor_fetch', 'sort', 'frontier', 'path')
+NEIGHBOR_FETCH, SORT, FRONTIER, PATH = range(len(PHASES))
+COUNTERS = ('neighbor_fetches', 'sort_calls', 'pushes', 'pops', 'revisits', 'duplicate_pushes')
+
+
+class SearchProfiler:
+    """Counters, per-phase times and an optional event trace for one search.
+    
+    ``revisits`` counts encounters of an already visited node (stale stack
+    pops in DFS, visited neighbours in BFS); ``duplicate_pushes`` counts DFS
+    pushes of a node that already has a parent, i.e. is already on the stack.
+    With ``trace=True`` up to ``max_events`` phase spans are kept in flat
+    arrays and can be exported as Chrome trace JSON (chrome://tracing,
+    Perfetto).
+    """
+    
+    def __init__(self, trace: bool = False, max_events: int = 200_000):
+        self.trace = trace
+        self.max_events = max_events
+        self.reset()
+    
+    def reset(self):
+        self.counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.phase_ns: Dict[str, int] = dict.fromkeys(PHASES, 0)
+        self.total_ns = 0
+        self.algorithm = None
+        self._origin = time.perf_counter_ns()
+        self._phases = bytearray()
+        self._nodes: List = []
+        self._begin = array('q')
+        self._duration = array('q')
+    
+    def record(self, phase: int, node, begin: int, end: int):
+        self.phase_ns[PHASES[phase]] += end - begin
+        if self.trace and len(self._begin) < self.max_events:
+            self._phases.append(phase)
+            self._nodes.append(node)
+            self._begin.append(begin - self._origin)
+            self._duration.append(end - begin)
+    
+    def summary(self) -> Dict:
+        return {'algorithm': self.algorithm, 'total_ns': self.total_ns,
+                **self.counters, **{f"{phase}_ns": ns for phase, ns in self.phase_ns.items()}}
+    
+    def report(self) -> str:
+        total = self.total_ns or 1
+        lines = [f"Profilis ({self.algorithm}): {self.total_ns/1e6:.4f} ms"]
+        lines += [f"  {name:<18} {value}" for name, value in self.counters.items()]
+        lines += [f"  {phase + ' (ms)':<18} {ns/1e6:.4f} ({100*ns/total:.1f}%)" for phase, ns in self.phase_ns.items()]
+        return "\n".join(lines)
+    
+    def to_chrome_trace(self) -> Dict:
+        # Complete ("X") events with microsecond timestamps
+        events = [{'name': PHASES[phase], 'ph': 'X', 'pid': 1, 'tid': 1,
+                   'ts': begin / 1000, 'dur': duration / 1000, 'args': {'node': node}}
+                  for phase, node, begin, duration in zip(self._phases, self._nodes, self._begin, self._duration)]
+        return {'traceEvents': events, 'displayTimeUnit': 'ns', 'otherData': self.summary()}
+    
+    def write_chrome_trace(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f, separators=(',', ':'), default=str)
+
+
+def profiled_dfs(graph, start: int, goal: int, profiler: SearchProfiler) -> Tuple[List[int], List[int]]:
+    clock = time.perf_counter_ns
+    counters = profiler.counters
+    record = profiler.record
+    profiler.algorithm = 'dfs'
+    visited = set()
+    visited_order = []
+    parent = {start: None}
+    stack = [start]
+    counters['pushes'] += 1
+    
+    while stack:
+        begin = clock()
+        node = stack.pop()
+        counters['pops'] += 1
+        if node in visited:
+            counters['revisits'] += 1
+            record(FRONTIER, node, begin, clock())
+            continue
+        visited.add(node)
+        visited_order.append(node)
+        fetch = clock()
+        record(FRONTIER, node, begin, fetch)
+        
+        if node == goal:
+            path = _reconstruct_path(parent, start, goal)
+            record(PATH, node, fetch, clock())
+            return path, visited_order
+        
+        neighbors = list(graph.neighbors(node))
+        counters['neighbor_fetches'] += 1
+        sort = clock()
+        record(NEIGHBOR_FETCH, node, fetch, sort)
+        neighbors.sort(reverse=True)
+        counters['sort_calls'] += 1
+        push = clock()
+        record(SORT, node, sort, push)
+        
+        for neighbor in neighbors:
+            if neighbor not in visited:
+                if neighbor not in parent:
+                    parent[neighbor] = node
+                else:
+                    counters['duplicate_pushes'] += 1
+                stack.append(neighbor)
+                counters['pushes'] += 1
+            else:
+                counters['revisits'] += 1
+        record(FRONTIER, node, push, clock())
+    
+    return [], visited_order
+
+
+def profiled_bfs(graph, start: int, goal: int, profiler: SearchProfiler) -> Tuple[List[int], List[int]]:
+    clock = time.perf_counter_ns
+    counters = profiler.counters
+    record = profiler.record
+    profiler.algorithm = 'bfs'
+    visited = {start}
+    visited_order = []
+    parent = {start: None}
+    queue = deque([start])
+    counters['pushes'] += 1
+    
+    while queue:
+        begin = clock()
+        node = queue.popleft()
+        counters['pops'] += 1
+        visited_order.append(node)
+        fetch = clock()
+        record(FRONTIER, node, begin, fetch)
+        
+        if node == goal:
+            path = _reconstruct_path(parent, start, goal)
+            record(PATH, node, fetch, clock())
+            return path, visited_order
+        
+        neighbors = list(graph.neighbors(node))
+        counters['neighbor_fetches'] += 1
+        sort = clock()
+        record(NEIGHBOR_FETCH, node, fetch, sort)
+        neighbors.sort()
+        counters['sort_calls'] += 1
+        push = clock()
+        record(SORT, node, sort, push)
+        
+        for neighbor in neighbors:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                parent[neighbor] = node
+                queue.append(neighbor)
+                counters['pushes'] += 1
+            else:
+                counters['revisits'] += 1
+        record(FRONTIER, node, push, clock())
+    
+    return [], visited_order
@@ -0,0 +1,103 @@
+import time
+from collections import deque
+from typing import Callable, Generator, Iterable, List, NamedTuple, Optional, Tuple
+
+from .csr_graph import _reconstruct_path
+
+
+class VisitEvent(NamedTuple):
+    node: int
+    depth: int
+    parent: Optional[int]
+
+
+# Generator versions of GraphSearchComparison.dfs/bfs. They visit nodes in
+# exactly the same order and keep only the frontier and visited/parent state;
+# the visit order is never stored. The consumer controls the pace: stop with
+# `break` or close(), pause by not calling next(), cap with max_visits or
+# islice. When the goal is reached the generator returns its path
+# (StopIteration.value), otherwise an empty list.
+
+VisitStream = Generator[VisitEvent, None, List[int]]
+
+
+def iter_dfs(neighbors: Callable[[int], Iterable[int]], start: int, goal: Optional[int] = None,
+             max_visits: Optional[int] = None) -> VisitStream:
+    # parent holds the first pusher like the parent dict of dfs, so the
+    # events' parents give the same path
+    visited = set()
+    parent = {start: None}
+    depth_of = {start: 0}
+    stack = [start]
+    
+    while stack:
+        node = stack.pop()
+        if node in visited:
+            continue
+        visited.add(node)
+        depth = depth_of[node]
+        yield VisitEvent(node, depth, parent[node])
+        
+        if node == goal:
+            return _reconstruct_path(parent, start, goal)
+        if max_visits is not None and len(visited) >= max_visits:
+            return []
+        
+        for neighbor in sorted(neighbors(node), reverse=True):
+            if neighbor not in visited:
+                if neighbor not in parent:
+                    parent[neighbor] = node
+                    depth_of[neighbor] = depth + 1
+                stack.append(neighbor)
+    return []
+
+
+def iter_bfs(neighbors: Callable[[int], Iterable[int]], start: int, goal: Optional[int] = None,
+             max_visits: Optional[int] = None) -> VisitStream:
+    # parent doubles as the visited set
+    parent = {start: None}
+    depth_of = {start: 0}
+    queue = deque([start])
+    visits = 0
+    
+    while queue:
+        node = queue.popleft()
+        depth = depth_of[node]
+        yield VisitEvent(node, depth, parent[node])
+        visits += 1
+        
+        if node == goal:
+            return _reconstruct_path(parent, start, goal)
+        if max_visits is not None and visits >= max_visits:
+            return []
+        
+        for neighbor in sorted(neighbors(node)):
+            if neighbor not in parent:
+                parent[neighbor] = node
+                depth_of[neighbor] = depth + 1
+                queue.append(neighbor)
+    return []
+
+
+def summarize_stream(events: VisitStream, keep_order: Optional[int] = 20) -> Tuple[List[int], List[int], float, int]:
+    """Drain a visit stream into the usual (path, order, time, explored) tuple.
+    
+    Only the first ``keep_order`` visited nodes are kept (``None`` keeps the
+    whole order), which is all print_comparison_results shows.
+    """
+    start_time = time.perf_counter()
+    order = []
+    explored = 0
+    path = []
+    while True:
+        try:
+            event = next(events)
+        except StopIteration as stop:
+            path = stop.value or []
+            break
+        if keep_order is None or explored < keep_order:
+            order.append(event.node)
+        explored += 1
+    end_time = time.perf_counter()
+    return path, order, end_time - start_time, explored
+
@@ -0,0 +1,190 @@
+import hashlib
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+import networkx as nx
+import numpy as np
+
+from .csr_graph import CSRGraph
+from .traversal_stream import iter_bfs
+
+
+def graph_fingerprint(graph: nx.Graph) -> str:
+    # Content hash of the CSR form, stable across runs and processes
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx(graph)
+    return hashlib.sha1(csr.to_bytes()).hexdigest()
+
+
+def force_layout(graph: nx.Graph, seed: int = 42, iterations: int = 50) -> Dict[int, np.ndarray]:
+    # Dense Fruchterman-Reingold in NumPy for the downsampled drawings;
+    # nx.spring_layout needs SciPy above 500 nodes
+    nodes = list(graph.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = np.array([(index[u], index[v]) for u, v in graph.edges()], dtype=np.intp).reshape(-1, 2)
+    pos = np.random.default_rng(seed).random((len(nodes), 2))
+    k = 1 / np.sqrt(max(1, len(nodes)))
+    temperature = 0.1
+    
+    for _ in range(iterations):
+        delta = pos[:, None, :] - pos[None, :, :]
+        distance = np.maximum(np.linalg.norm(delta, axis=-1), 0.01)
+        displacement = np.einsum('ijk,ij->ik', delta, (k / distance) ** 2)
+        edge_delta = pos[edges[:, 0]] - pos[edges[:, 1]]
+        edge_length = np.maximum(np.linalg.norm(edge_delta, axis=1), 0.01)
+        pull = edge_delta * (edge_length / k)[:, None]
+        np.subtract.at(displacement, edges[:, 0], pull)
+        np.add.at(displacement, edges[:, 1], pull)
+        length = np.maximum(np.linalg.norm(displacement, axis=1), 0.01)
+        pos += displacement * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= 0.1 / (iterations + 1)
+    return dict(zip(nodes, pos))
+
+
+class ComparisonRenderer:
+    """Draws the run_comparison figure (graph + one panel per algorithm).
+    
+    The layout is computed once per graph and cached in memory and on disk
+    (``layout_cache_dir``, keyed by graph_fingerprint). Graphs with more than
+    ``large_graph_threshold`` nodes are drawn without labels, rasterized and
+    downsampled to the paths, start, goal and the first nodes in BFS order
+    from the start, up to ``max_drawn_nodes``. With ``background=True`` render() returns a Future and
+    the drawing runs on a worker thread; call wait() before exiting.
+    """
+    
+    def __init__(self, output_dir: str = '.', layout_cache_dir: Optional[str] = None,
+                 background: bool = False, large_graph_threshold: int = 400,
+                 max_drawn_nodes: int = 1000, dpi: int = 150, seed: int = 42):
+        self.output_dir = output_dir
+        self.layout_cache_dir = layout_cache_dir if layout_cache_dir is not None else \
+            os.path.join(output_dir, '.layout_cache')
+        self.large_graph_threshold = large_graph_threshold
+        self.max_drawn_nodes = max_drawn_nodes
+        self.dpi = dpi
+        self.seed = seed
+        self._layouts: Dict[str, Dict[int, np.ndarray]] = {}
+        self._executor = ThreadPoolExecutor(max_workers=1) if background else None
+        self._pending: List[Future] = []
+    
+    def layout(self, graph: nx.Graph, fingerprint: Optional[str] = None) -> Dict[int, np.ndarray]:
+        fingerprint = fingerprint or graph_fingerprint(graph)
+        key = f"{fingerprint}_{self.seed}"
+        if key in self._layouts:
+            return self._layouts[key]
+        
+        nodes = sorted(graph.nodes())
+        cache_path = os.path.join(self.layout_cache_dir, f"{key}.npy") if self.layout_cache_dir else None
+        if cache_path and os.path.exists(cache_path):
+            coords = np.load(cache_path)
+            pos = dict(zip(nodes, coords))
+        else:
+            if graph.number_of_nodes() <= self.large_graph_threshold:
+                pos = nx.spring_layout(graph, seed=self.seed)
+            else:
+                pos = force_layout(graph, seed=self.seed)
+            if cache_path:
+                os.makedirs(self.layout_cache_dir, exist_ok=True)
+                np.save(cache_path, np.array([pos[node] for node in nodes]))
+        
+        self._layouts[key] = pos
+        return pos
+    
+    def output_path(self, graph_name: str) -> str:
+        return os.path.join(self.output_dir, f"{graph_name.replace(' ', '_')}.png")
+    
+    def render(self, graph, graph_name: str, start_node: int, goal_node: int,
+               results: Dict[str, tuple], titles: Dict[str, str]):
+        # Returns the PNG path, or a Future of it in background mode
+        if self._executor is None:
+            return self._render(graph, graph_name, start_node, goal_node, results, titles)
+        future = self._executor.submit(self._render, graph, graph_name, start_node, goal_node, results, titles)
+        self._pending.append(future)
+        return future
+    
+    def wait(self) -> List[str]:
+        paths = [future.result() for future in self._pending]
+        self._pending = []
+        return paths
+    
+    def close(self):
+        self.wait()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    def _drawn_subgraph(self, graph, start_node: int, goal_node: int,
+                        results: Dict[str, tuple]) -> nx.Graph:
+        # `graph` may also be a (memory-mapped) CSRGraph; only the drawn part
+        # is turned into networkx
+        if graph.number_of_nodes() <= self.max_drawn_nodes:
+            return graph.to_networkx() if isinstance(graph, CSRGraph) else graph
+        keep = {start_node, goal_node}
+        for path, *_ in results.values():
+            keep.update(path)
+        limit = max(1, self.max_drawn_nodes - len(keep))
+        keep.update(event.node for event in iter_bfs(graph.neighbors, start_node, max_visits=limit))
+        
+        drawn = nx.Graph()
+        drawn.add_nodes_from(sorted(keep))
+        drawn.add_edges_from((u, v) for u in keep for v in graph.neighbors(u) if v in keep)
+        return drawn
+    
+    def _render(self, graph, graph_name: str, start_node: int, goal_node: int,
+                results: Dict[str, tuple], titles: Dict[str, str]) -> str:
+        drawn = self._drawn_subgraph(graph, start_node, goal_node, results)
+        large = graph.number_of_nodes() > self.large_graph_threshold
+        pos = self.layout(drawn)
+        
+        columns = len(results) + 1
+        figure = Figure(figsize=(6 * columns, 6))
+        FigureCanvasAgg(figure)
+        axes = figure.subplots(1, columns, squeeze=False)[0]
+        
+        suffix = f"\n(rodoma {drawn.number_of_nodes()} iš {graph.number_of_nodes()} viršūnių)" \
+            if drawn.number_of_nodes() < graph.number_of_nodes() else ""
+        self._draw_panel(axes[0], drawn, pos, set(), [], start_node, goal_node, large)
+        axes[0].set_title(f"{graph_name}\nPradžia (žalia), Tikslas (raudona){suffix}", fontweight='bold')
+        
+        for ax, (algorithm, (path, visited, _, explored)) in zip(axes[1:], results.items()):
+            self._draw_panel(ax, drawn, pos, set(visited), path, start_node, goal_node, large)
+            ax.set_title(f"{titles[algorithm]} rezultatai\nKelias: {len(path)}, Aplankyta: {explored}",
+                         fontweight='bold')
+        
+        figure.tight_layout()
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = self.output_path(graph_name)
+        figure.savefig(path, dpi=self.dpi, bbox_inches='tight')
+        return path
+    
+    def _draw_panel(self, ax, graph: nx.Graph, pos: Dict[int, np.ndarray], visited: set, path: List[int],
+                    start_node: int, goal_node: int, large: bool):
+        path_edges = [(path[i], path[i+1]) for i in range(len(path) - 1)]
+        if not large:
+            node_colors = ['yellow' if node in visited else 'lightblue' for node in graph.nodes()]
+            nx.draw(graph, pos, ax=ax, node_color=node_colors, with_labels=True,
+                    node_size=500, font_size=10, font_weight='bold')
+            if path_edges:
+                nx.draw_networkx_edges(graph, pos, path_edges, ax=ax, edge_color='red', width=3)
+            nx.draw_networkx_nodes(graph, pos, [start_node], ax=ax, node_color='green', node_size=600)
+            nx.draw_networkx_nodes(graph, pos, [goal_node], ax=ax, node_color='red', node_size=600)
+        else:
+            # Plain collections, rasterized so the PNG/PDF cost does not grow with E
+            nodes = list(graph.nodes())
+            coords = np.array([pos[node] for node in nodes])
+            segments = [(pos[u], pos[v]) for u, v in graph.edges()]
+            ax.add_collection(LineCollection(segments, colors='lightgray', linewidths=0.3, rasterized=True))
+            is_visited = np.fromiter((node in visited for node in nodes), dtype=bool, count=len(nodes))
+            colors = np.where(is_visited, 'yellow', 'lightblue')
+            ax.scatter(coords[:, 0], coords[:, 1], c=colors, s=6, linewidths=0, rasterized=True)
+            if path_edges:
+                ax.add_collection(LineCollection([(pos[u], pos[v]) for u, v in path_edges],
+                                                 colors='red', linewidths=1.5))
+            for node, color in ((start_node, 'green'), (goal_node, 'red')):
+                ax.scatter([pos[node][0]], [pos[node][1]], c=color, s=40, zorder=3)
+            ax.autoscale_view()
+        ax.axis('off')
@@ -0,0 +1,78 @@
+import heapq
+from array import array
+from typing import Callable, List, Optional, Tuple
+
+from .csr_graph import CSRGraph, _reconstruct_path, _record_structures
+
+# Uniform-cost search and A* over a CSRGraph, in index space. Edge costs come
+# from csr.weights (1 for every edge when the graph has none). The open list
+# is a heapq of (f, h, node, g) entries with lazy deletion: a cheaper route
+# pushes a new entry and the stale one (g above the best known) is skipped
+# when it is popped, instead of searching the heap for a decrease-key.
+
+
+def csr_astar(csr: CSRGraph, start: int, goal: int, heuristic: Optional[Callable[[int], float]] = None,
+              stats: Optional[dict] = None) -> Tuple[List[int], List[int], float]:
+    """A* from ``start`` to ``goal``; without a heuristic this is UCS/Dijkstra.
+    
+    ``heuristic(i)`` estimates the remaining cost from index ``i`` and must
+    not overestimate it for the returned path to be optimal. An expanded
+    node is reopened when a cheaper route to it turns up, which only
+    happens with an inconsistent heuristic; it then appears in the order
+    again. Returns ``(path, expansion order, path cost)``; the cost is
+    ``inf`` when no path exists. Ties on f go to the smaller h (the deeper
+    node), then the smaller index.
+    """
+    n = csr.number_of_nodes()
+    offsets = csr.offsets
+    nbrs = csr.neighbors_idx
+    weights = csr.weights
+    distance = array('d', [float('inf')]) * n
+    parent = array('i', [-1]) * n
+    distance[start] = 0.0
+    parent[start] = start
+    estimate = heuristic(start) if heuristic else 0.0
+    heap = [(estimate, estimate, start, 0.0)]
+    settled_order = []
+    track = stats is not None
+    peak_frontier = 1
+    
+    while heap:
+        _, _, node, base = heapq.heappop(heap)
+        if base > distance[node]:
+            continue
+        settled_order.append(node)
+        
+        if node == goal:
+            _record_structures(stats, peak_frontier, len(settled_order), parent)
+            return _reconstruct_path(parent, start, goal), settled_order, distance[goal]
+        
+        for k in range(offsets[node], offsets[node + 1]):
+            neighbor = nbrs[k]
+            cost = base + (1.0 if weights is None else weights[k])
+            if cost < distance[neighbor]:
+                distance[neighbor] = cost
+                parent[neighbor] = node
+                estimate = heuristic(neighbor) if heuristic else 0.0
+                heapq.heappush(heap, (cost + estimate, estimate, neighbor, cost))
+        
+        if track and len(heap) > peak_frontier:
+            peak_frontier = len(heap)
+    
+    _record_structures(stats, peak_frontier, len(settled_order), parent)
+    return [], settled_order, float('inf')
+
+
+def csr_ucs(csr: CSRGraph, start: int, goal: int,
+            stats: Optional[dict] = None) -> Tuple[List[int], List[int], float]:
+    return csr_astar(csr, start, goal, None, stats)
+
+
+def manhattan_heuristic(cols: int) -> Callable[[int, int], float]:
+    # Grid labels are r * cols + c (generate_grid_graph); admissible while
+    # every edge costs at least 1
+    def heuristic(node: int, goal: int) -> float:
+        row, col = divmod(node, cols)
+        goal_row, goal_col = divmod(goal, cols)
+        return abs(row - goal_row) + abs(col - goal_col)
+    return heuristic
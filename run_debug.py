@@ -2,4 +2,6 @@
 import sys
 sys.stdout = sys.stderr  # Force all output to stderr
 
-exec(open('search_algorithms_data.py').read())
+from search_algorithms_data import main
+
+sys.exit(main())
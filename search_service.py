@@ -0,0 +1,194 @@
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from graph_search import parallel_runner
+from graph_search.csr_graph import CSRGraph
+from graph_search.datasets import DATASETS, generate_grid_graph
+from graph_search.report import percentile
+from graph_search.search import ALGORITHMS, GraphSearchComparison
+
+
+class QueryResult(NamedTuple):
+    path: List[int]
+    exec_time: float
+    nodes_explored: int
+
+
+def _run_query(job: Tuple[int, str, int, int],
+               searchers: Optional[Dict[int, GraphSearchComparison]] = None) -> QueryResult:
+    # Runs in a worker; the visit order stays there, only the answer comes back.
+    # Threads get the service's own searchers, processes use the ones
+    # parallel_runner._init_worker loaded.
+    dataset_id, algorithm, start, goal = job
+    if searchers is None:
+        searchers = parallel_runner._worker_searchers
+    path, _, exec_time, explored = getattr(searchers[dataset_id], algorithm)(start, goal)
+    return QueryResult(list(path), exec_time, explored)
+
+
+class SearchService:
+    """Asyncio front end for concurrent path queries on preloaded graphs.
+    
+    Graphs are frozen to CSR once and handed to every worker through the pool
+    initializer, as in parallel_runner. ``query`` runs the search on the pool,
+    so the event loop never blocks. Identical in-flight queries share one
+    search; each caller has its own timeout and can be cancelled on its own,
+    and a queued search is cancelled once nobody waits for it any more (a
+    search that already started runs to completion in its worker).
+    """
+    
+    def __init__(self, graphs: Dict[str, object], max_workers: Optional[int] = None,
+                 timeout: Optional[float] = 5.0, use_threads: bool = False):
+        self.graph_ids = {name: i for i, name in enumerate(graphs)}
+        self.timeout = timeout
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.use_threads = use_threads
+        self._payloads = []
+        for name, graph in graphs.items():
+            csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx(graph)
+            self._payloads.append((name, csr.to_bytes()))
+        self._executor: Optional[Executor] = None
+        self._searchers: Optional[Dict[int, GraphSearchComparison]] = None
+        self._inflight: Dict[Tuple[int, str, int, int], asyncio.Future] = {}
+        self._waiters: Dict[Tuple[int, str, int, int], int] = {}
+        self.coalesced = 0
+    
+    def start(self):
+        if self._executor is None:
+            if self.use_threads:
+                # Kept on the instance, so services in one process do not
+                # overwrite each other's graphs
+                self._searchers = parallel_runner._load_searchers(self._payloads)
+                self._executor = ThreadPoolExecutor(self.max_workers)
+            else:
+                self._executor = ProcessPoolExecutor(self.max_workers, initializer=parallel_runner._init_worker,
+                                                     initargs=(self._payloads,))
+    
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+            self._searchers = None
+    
+    async def __aenter__(self) -> 'SearchService':
+        self.start()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        self.close()
+    
+    async def query(self, graph_name: str, start: int, goal: int, algorithm: str = 'bfs',
+                    timeout: Optional[float] = None) -> QueryResult:
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Nežinomas algoritmas: {algorithm}")
+        self.start()
+        key = (self.graph_ids[graph_name], algorithm, start, goal)
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().run_in_executor(self._executor, _run_query, key, self._searchers)
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._forget(key, future))
+        else:
+            self.coalesced += 1
+        
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            # shield: one caller timing out must not cancel the shared search
+            return await asyncio.wait_for(asyncio.shield(future), timeout if timeout is not None else self.timeout)
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+                if not future.done():
+                    future.cancel()
+                    self._forget(key, future)
+    
+    def _forget(self, key: Tuple[int, str, int, int], future: asyncio.Future):
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+
+async def run_load(service: SearchService, graph_name: str, queries: Sequence[Tuple[int, int]],
+                   algorithm: str = 'bfs', concurrency: int = 32) -> Dict:
+    # `concurrency` clients take queries from a shared list as fast as they can
+    latencies = []
+    timeouts = 0
+    next_query = iter(queries)
+    
+    async def client():
+        nonlocal timeouts
+        for start, goal in next_query:
+            begin = time.perf_counter_ns()
+            try:
+                await service.query(graph_name, start, goal, algorithm)
+            except asyncio.TimeoutError:
+                timeouts += 1
+                continue
+            latencies.append(time.perf_counter_ns() - begin)
+    
+    begin = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - begin
+    return {
+        'queries': len(queries),
+        'completed': len(latencies),
+        'timeouts': timeouts,
+        'coalesced': service.coalesced,
+        'seconds': elapsed,
+        'throughput_qps': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 0.50) / 1e6 if latencies else None,
+        'p95_ms': percentile(latencies, 0.95) / 1e6 if latencies else None,
+        'p99_ms': percentile(latencies, 0.99) / 1e6 if latencies else None,
+        'mean_ms': statistics.fmean(latencies) / 1e6 if latencies else None,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Asinchroninės paieškos paslaugos apkrovos testas")
+    parser.add_argument('--dataset', type=int, choices=range(1, len(DATASETS) + 1), default=2,
+                        help="užduoties rinkinio numeris (nuo 1)")
+    parser.add_argument('--grid', type=int, help="vietoj rinkinio naudoti N×N tinklelį")
+    parser.add_argument('--algorithm', choices=list(ALGORITHMS), default='bfs')
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--distinct', type=int, default=200, help="skirtingų užklausų skaičius")
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--timeout', type=float, default=5.0)
+    parser.add_argument('--threads', action='store_true', help="gijos vietoj procesų")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+    
+    if args.grid:
+        graph_name, graph = f"Tinklelis {args.grid}x{args.grid}", generate_grid_graph(args.grid, args.grid)
+    else:
+        graph_name, graph_gen_func, _, _ = DATASETS[args.dataset - 1]
+        graph = graph_gen_func()
+    nodes = sorted(graph.nodes())
+    rng = random.Random(args.seed)
+    distinct = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(args.distinct)]
+    queries = [rng.choice(distinct) for _ in range(args.queries)]
+    
+    async def run() -> Dict:
+        async with SearchService({graph_name: graph}, args.workers, args.timeout, args.threads) as service:
+            return await run_load(service, graph_name, queries, args.algorithm, args.concurrency)
+    
+    report = asyncio.run(run())
+    print(f"{graph_name} ({args.algorithm}, {args.concurrency} klientų)")
+    print(f"  Užklausų: {report['queries']}, įvykdyta: {report['completed']}, "
+          f"viršytas laikas: {report['timeouts']}, sujungta: {report['coalesced']}")
+    print(f"  Pralaidumas: {report['throughput_qps']:.1f} užkl./s")
+    if report['completed']:
+        print(f"  Vėlinimas: p50 {report['p50_ms']:.3f} ms | p95 {report['p95_ms']:.3f} ms | "
+              f"p99 {report['p99_ms']:.3f} ms | vidurkis {report['mean_ms']:.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -34,6 +34,6 @@ print(f"BFS result: {result}")
 # Create simple visualization
 plt.figure(figsize=(8, 6))
 nx.draw(G, with_labels=True, node_color='lightblue', node_size=500)
-plt.savefig('/mnt/d/programing/intelektika-1/test_graph.png')
+plt.savefig('test_graph.png')
 print("✓ Test graph saved to test_graph.png")
 print("Test completed successfully!")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# Randomized check: the csr, compact, bfs_frontier and multi_goal_search
+# modes must give exactly the path and visit order of the networkx dfs/bfs,
+# and CSRGraph.to_bytes/from_bytes/save/load must round-trip the graph.
+# Run as a script: python test_csr_kernels.py [seed]
+import os
+import random
+import sys
+import tempfile
+
+import networkx as nx
+
+from graph_search.csr_graph import CSRGraph
+from graph_search.datasets import assign_random_weights, generate_grid_graph
+from graph_search.search import GraphSearchComparison
+
+GRAPHS = 400
+QUERIES = 5
+
+
+def _random_graph(rng: random.Random, trial: int) -> nx.Graph:
+    n = rng.choice([1, 10, 40, 120])
+    G = nx.gnp_random_graph(n, rng.choice([0.02, 0.05, 0.15]), seed=rng.randrange(10 ** 9))
+    kind = trial % 4
+    if kind == 1:
+        G = nx.relabel_nodes(G, lambda node: f"v{node:03d}")
+    elif kind == 2:
+        G = nx.relabel_nodes(G, lambda node: (node // 7, node % 7))
+    elif kind == 3:
+        G = assign_random_weights(G, trial)
+    return G
+
+
+def _same_graph(a: CSRGraph, b: CSRGraph) -> bool:
+    return (list(a.offsets) == list(b.offsets) and list(a.neighbors_idx) == list(b.neighbors_idx)
+            and a.labels == b.labels and a.graph == b.graph
+            and (a.weights is None) == (b.weights is None)
+            and (a.weights is None or list(a.weights) == list(b.weights)))
+
+
+def _check_round_trip(csr: CSRGraph, directory: str) -> bool:
+    path = os.path.join(directory, 'grafas.csr')
+    csr.save(path)
+    copies = [CSRGraph.from_bytes(csr.to_bytes()), CSRGraph.from_bytes(csr.to_bytes(), copy=False),
+              CSRGraph.load(path), CSRGraph.load(path, use_mmap=False)]
+    return all(_same_graph(csr, copy) for copy in copies)
+
+
+def main(seed: int = 0) -> int:
+    print("Starting CSR kernel test...")
+    rng = random.Random(seed)
+    checked = 0
+    
+    with tempfile.TemporaryDirectory() as directory:
+        grid = generate_grid_graph(6, 7)
+        if not _check_round_trip(CSRGraph.from_networkx(grid), directory):
+            print("✗ Tinklelio CSR failas nesutampa")
+            return 1
+        
+        for trial in range(GRAPHS):
+            G = _random_graph(rng, trial)
+            if not _check_round_trip(CSRGraph.from_networkx(G), directory):
+                print(f"✗ CSR failas nesutampa: seed={seed}, grafas {trial}")
+                return 1
+            
+            reference = GraphSearchComparison(G, f"{trial} grafas")
+            searchers = {
+                'csr': GraphSearchComparison(G, f"{trial} grafas", engine='csr'),
+                'compact': GraphSearchComparison(G, f"{trial} grafas", compact=True),
+            }
+            nodes = sorted(G.nodes())
+            for _ in range(QUERIES):
+                start, goal = rng.choice(nodes), rng.choice(nodes)
+                for algorithm in ('dfs', 'bfs'):
+                    path, visited, _, explored = getattr(reference, algorithm)(start, goal)
+                    results = {mode: getattr(searcher, algorithm)(start, goal)
+                               for mode, searcher in searchers.items()}
+                    if algorithm == 'bfs':
+                        results['bfs_frontier'] = reference.bfs_frontier(start, goal)
+                    for mode, (other_path, other_visited, _, other_explored) in results.items():
+                        if (other_path, list(other_visited), other_explored) != (path, visited, explored):
+                            print(f"✗ {mode} {algorithm} nesutampa: seed={seed}, grafas {trial}, "
+                                  f"{start} -> {goal}")
+                            return 1
+                    
+                    goals = rng.sample(nodes, min(3, len(nodes)))
+                    tree = reference.multi_goal_search(start, goals, algorithm)
+                    for tree_goal in goals:
+                        if tree.path_to(tree_goal) != getattr(reference, algorithm)(start, tree_goal)[0]:
+                            print(f"✗ multi_goal_search {algorithm} nesutampa: seed={seed}, grafas {trial}, "
+                                  f"{start} -> {tree_goal}")
+                            return 1
+                    checked += 1
+    
+    print(f"✓ {GRAPHS} grafų, patikrinta {checked} užklausų")
+    print("Test completed successfully!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 0))
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# Randomized check: IncrementalBFS repaired after every edge insert/delete
+# must give exactly what a fresh bfs gives (path, visit order, explored).
+# Run as a script: python test_dynamic_bfs.py [seed]
+import random
+import sys
+
+import networkx as nx
+
+from graph_search.dynamic_bfs import IncrementalBFS
+from graph_search.search import GraphSearchComparison
+
+GRAPHS = 300
+EDITS = 30
+GOALS = 5
+
+
+def main(seed: int = 0) -> int:
+    print("Starting IncrementalBFS test...")
+    rng = random.Random(seed)
+    checked = 0
+    
+    for trial in range(GRAPHS):
+        n = rng.choice([10, 30, 80])
+        G = nx.gnp_random_graph(n, rng.choice([0.03, 0.08, 0.2]), seed=rng.randrange(10 ** 9))
+        start = rng.randrange(n)
+        tree = IncrementalBFS(G.neighbors, start)
+        # bfs itself never reads the cache, so direct edits of G are fine here
+        reference = GraphSearchComparison(G, f"{trial} grafas")
+        
+        for edit in range(EDITS):
+            if rng.random() < 0.5 and G.number_of_edges():
+                u, v = rng.choice(list(G.edges()))
+                G.remove_edge(u, v)
+                tree.edge_removed(u, v)
+            else:
+                # May add a brand new node past n
+                u, v = rng.sample(range(n + 2), 2)
+                G.add_edge(u, v)
+                tree.edge_added(u, v)
+            
+            goals = rng.sample(list(G.nodes()), min(GOALS, G.number_of_nodes())) + [start]
+            for goal in goals:
+                path, visited, _, explored = reference.bfs(start, goal)
+                if tree.result(goal) != (path, visited, explored):
+                    print(f"✗ Neatitikimas: seed={seed}, grafas {trial}, keitimas {edit}, tikslas {goal}")
+                    return 1
+                checked += 1
+    
+    print(f"✓ {GRAPHS} grafų x {EDITS} keitimų, patikrinta {checked} užklausų")
+    print("Test completed successfully!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 0))